@@ -29,12 +29,22 @@ FLOOR_STD    = 0.02   # minimum std to prevent zero threshold
 # ---------------------------------------------------------------------------
 MAX_INTERVAL  = 3.0   # discard any interval / dwell longer than this (seconds)
 MIN_SAMPLES   = 5     # minimum flight-time samples for a valid baseline / check
+MIN_RHYTHM_OVERLAP = 0.3   # shorter rhythm vector must be >= this fraction of the
+                           # longer one, else the check is SUSPICIOUS unscored
 
 # ---------------------------------------------------------------------------
 # Session Monitor
 # ---------------------------------------------------------------------------
 RE_VERIFY_INTERVAL = 30   # seconds between continuous re-verification prompts
 
+# Adaptive interval: a confident pass stretches the wait, a marginal pass
+# shortens it. Margin = (threshold - risk) / threshold of a TRUSTED check.
+RE_VERIFY_MIN_INTERVAL     = 10     # seconds, floor after marginal passes
+RE_VERIFY_MAX_INTERVAL     = 300    # seconds, cap after confident passes
+RE_VERIFY_BACKOFF          = 1.5    # factor applied when stretching / shortening
+RE_VERIFY_CONFIDENT_MARGIN = 0.5    # margin above which the interval grows
+RE_VERIFY_MARGINAL_MARGIN  = 0.15   # margin below which the interval shrinks
+
 # ---------------------------------------------------------------------------
 # Authentication Phrases
 # ---------------------------------------------------------------------------
@@ -47,12 +57,28 @@ REVERIFICATION_TEXT = "trust no one verify always"
 # ---------------------------------------------------------------------------
 BASELINE_FILE = "baseline_profile.json"
 
+# ---------------------------------------------------------------------------
+# Assessment Cache  (dev / replay only)
+# ---------------------------------------------------------------------------
+# Reuses the assessment for a byte-identical capture against the same
+# baseline. Off by default: a replayed capture would be accepted without
+# being re-scored, so only enable it for demos and test harnesses.
+ASSESSMENT_CACHE_ENABLED = False
+ASSESSMENT_CACHE_SIZE    = 256   # max cached assessments (oldest evicted first)
+
 # ---------------------------------------------------------------------------
 # Logging
 # ---------------------------------------------------------------------------
 LOG_FILE      = "security_log.txt"
 LOG_MAX_LINES = 50   # max lines shown in Option 4 log viewer
 
+LOG_QUEUE_SIZE   = 4096   # pending events held for the background log writer
+LOG_BATCH_MAX    = 64     # max events written per batch
+LOG_BATCH_WINDOW = 0.1    # seconds the writer waits to coalesce a batch
+
+LOG_MAX_BYTES          = 5 * 1024 * 1024   # rotate security_log.txt to .1 past this size
+LOG_ROTATE_CHECK_EVERY = 256               # writes between log size checks
+
 # ---------------------------------------------------------------------------
 # Risk Bar Display
 # ---------------------------------------------------------------------------
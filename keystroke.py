@@ -10,19 +10,48 @@ Captures the following behavioral biometric signals:
 Returns a structured dict for downstream risk analysis.
 """
 
-import time
-from pynput import keyboard
+import math
+import operator
+from time import perf_counter_ns as _now, sleep as _sleep
 import threading
 import sys
+from collections import defaultdict, deque
 
+import config
 
-# Bigrams of interest – can be extended for any passphrase
-TARGET_BIGRAMS = [
+
+# pynput.keyboard is imported on first use (or by preload_listener()): its
+# platform backend (Xlib / Quartz / win32) is slow to import and is not
+# needed until the first capture.
+_Listener = None
+
+# Bigrams of interest – can be extended for any passphrase.
+# A frozenset so the per-pair membership test is a hash lookup.
+TARGET_BIGRAMS = frozenset({
     "ze", "er", "ro", "co", "on", "nt", "ti", "in",
     "se", "ec", "ur", "ri", "it", "tr", "ru", "us",
     "st", "em", "au", "th", "he", "en", "ca", "at",
     "io", "an",
-]
+})
+
+# Timestamps are kept as integer nanoseconds and converted to seconds only
+# when a sample is stored.
+_NS_PER_SECOND = 1_000_000_000
+MAX_INTERVAL_NS = int(config.MAX_INTERVAL * _NS_PER_SECOND)
+
+# Precomputed lowercase for ASCII characters; anything else falls back to
+# str.lower(), so non-ASCII input is still folded correctly.
+_ASCII_LOWER = {chr(i): chr(i).lower() for i in range(128)}
+
+# Unmatched presses remembered per character for dwell matching. If a
+# release is never delivered (a known pynput issue on some platforms) the
+# oldest stale press is evicted instead of accumulating.
+_MAX_PENDING_PRESSES = 8
+
+# Event buffer sizing: a press and a release per prompt character, with
+# headroom for typos and retyping. Events past the capacity are dropped.
+_EVENT_SLOTS_PER_CHAR = 8
+_MIN_EVENT_SLOTS      = 256
 
 
 class KeystrokeCapture:
@@ -32,6 +61,15 @@ class KeystrokeCapture:
     Registers both on_press and on_release callbacks so that:
       - press timestamps  → flight times & bigram times
       - release timestamps → dwell times
+
+    The callbacks run on pynput's dispatcher thread, which sits on the OS
+    input path, so they only append a raw (timestamp, is_press, char) event;
+    timestamps are nanoseconds relative to the start of the capture.
+    All metric derivation happens in _process_events() once capture ends.
+
+    The listener (a global OS keyboard hook) is started on the first
+    capture and kept installed for later ones; between captures the
+    callbacks return immediately. Call close() to remove it.
     """
 
     def __init__(self):
@@ -39,23 +77,27 @@ class KeystrokeCapture:
         self.flight_times = []      # interval between consecutive presses
         self.dwell_times = []       # how long each key was held
         self.bigrams = {}           # {"co": [0.18, 0.20], ...}
-        self.rhythm_vector = []     # same as flight_times (explicit copy for vector math)
+        self.bigram_avg = {}        # {"co": 0.19, ...} – filled after capture
+        # rhythm_vector is not tracked separately – it is a copy of
+        # flight_times materialised when the capture result is returned.
 
-        # --- internal state ---
-        self._press_times = {}      # key → press timestamp (for dwell)
-        self._last_press_time = None
-        self._prev_char = None      # previous character (for bigram detection)
-        self._typed_chars = []      # running list of typed characters
+        # --- raw event log: (ns since capture start, is_press, char) ---
+        # Preallocated per capture; _n_events is the fill index.
+        self._events = []
+        self._n_events = 0
+        self._t0 = 0                # perf_counter_ns() at capture start
+        self._typed_chars = []      # running list of typed characters (unbounded)
 
         self.capturing = False
         self.capture_complete = threading.Event()
         self.listener = None
 
         # Filter out pauses longer than this (seconds)
-        self.max_interval = 3.0
+        self.max_interval = config.MAX_INTERVAL
+        self._max_interval_ns = MAX_INTERVAL_NS
 
-        # Escape sequence state (:q to finish)
-        self._recent_chars = []
+        # Escape sequence state (:q to finish) – last character typed
+        self._prev_typed = ''
 
     # ------------------------------------------------------------------
     # Public API
@@ -73,19 +115,22 @@ class KeystrokeCapture:
                 flight_times  (list[float])
                 dwell_times   (list[float])
                 bigrams       (dict[str, list[float]])
+                bigram_avg    (dict[str, float])  mean of each bigrams list
                 rhythm_vector (list[float])
                 chars         (str)
+                n             (int)  number of flight times; 0 = no data
         """
         # Reset state
         self.flight_times = []
         self.dwell_times = []
         self.bigrams = {}
-        self.rhythm_vector = []
-        self._press_times = {}
-        self._last_press_time = None
-        self._prev_char = None
+        self.bigram_avg = {}
+        self._events = [None] * max(_MIN_EVENT_SLOTS,
+                                    len(prompt_text) * _EVENT_SLOTS_PER_CHAR)
+        self._n_events = 0
         self._typed_chars = []
-        self._recent_chars = []
+        self._prev_typed = ''
+        self._t0 = _now()
         self.capturing = True
         self.capture_complete.clear()
 
@@ -100,27 +145,26 @@ class KeystrokeCapture:
             pass
 
         try:
-            self.listener = keyboard.Listener(
-                on_press=self._on_key_press,
-                on_release=self._on_key_release,
-            )
-            self.listener.daemon = True
-            self.listener.start()
+            self._ensure_listener()
             # Wait up to 90 seconds for the user to finish
             self.capture_complete.wait(timeout=90)
         except Exception as e:
             print(f"Keyboard listener error: {e}")
             return self._empty_result()
+        finally:
+            # Stop recording before the event log is read (covers the timeout path)
+            self.capturing = False
 
-        # Clean up listener
-        if self.listener:
-            try:
-                self.listener.stop()
-                self.listener.join(timeout=2.0)
-            except Exception:
-                pass
+        self._process_events()
 
-        time.sleep(0.2)
+        n_flight = len(self.flight_times)
+        n_dwell  = len(self.dwell_times)
+        n_bigram = sum(len(v) for v in self.bigrams.values())
+        print(f"\n  ✓ Captured {n_flight} flight times | "
+              f"{n_dwell} dwell times | "
+              f"{n_bigram} bigram samples across {len(self.bigrams)} bigrams.")
+
+        _sleep(0.2)
 
         try:
             sys.stdin.flush()
@@ -131,20 +175,49 @@ class KeystrokeCapture:
             "flight_times":  self.flight_times,
             "dwell_times":   self.dwell_times,
             "bigrams":       self.bigrams,
+            "bigram_avg":    self.bigram_avg,
             "rhythm_vector": list(self.flight_times),  # identical sequence, separate reference
             "chars":         "".join(self._typed_chars),
+            "n":             n_flight,
         }
 
+    def close(self) -> None:
+        """Stop the keyboard listener, removing the OS input hook."""
+        self.capturing = False
+        if self.listener:
+            try:
+                self.listener.stop()
+                self.listener.join(timeout=2.0)
+            except Exception:
+                pass
+            self.listener = None
+
+    # ------------------------------------------------------------------
+    # Listener lifecycle
+    # ------------------------------------------------------------------
+
+    def _ensure_listener(self) -> None:
+        """Start the keyboard listener unless one is already running."""
+        if self.listener is not None and self.listener.is_alive():
+            return
+        preload_listener()
+        self.listener = _Listener(
+            on_press=self._on_key_press,
+            on_release=self._on_key_release,
+        )
+        self.listener.daemon = True
+        self.listener.start()
+
     # ------------------------------------------------------------------
     # Internal event handlers
     # ------------------------------------------------------------------
 
     def _on_key_press(self, key):
-        """Record key-press timestamp; derive flight time and bigram timing."""
+        """Record a key-press event; watch for the ':q' terminator."""
         if not self.capturing:
             return
 
-        current_time = time.time()
+        current_time = _now() - self._t0
 
         try:
             char = key.char
@@ -154,45 +227,25 @@ class KeystrokeCapture:
             # Special key (Shift, Ctrl, …) – skip
             return
 
-        char_lower = char.lower()
+        char_lower = _ASCII_LOWER.get(char) or char.lower()
         self._typed_chars.append(char_lower)
+        n = self._n_events
+        if n < len(self._events):
+            self._events[n] = (current_time, True, char_lower)
+            self._n_events = n + 1
 
         # --- Escape sequence detection (:q) ---
-        self._recent_chars.append(char_lower)
-        if len(self._recent_chars) > 2:
-            self._recent_chars.pop(0)
-        if (len(self._recent_chars) == 2
-                and self._recent_chars[0] == ':'
-                and self._recent_chars[1] == 'q'):
+        if self._prev_typed == ':' and char_lower == 'q':
             self._finish_capture()
             return
-
-        # --- Flight time (interval between consecutive presses) ---
-        if self._last_press_time is not None:
-            flight = current_time - self._last_press_time
-            if flight <= self.max_interval:
-                self.flight_times.append(round(flight, 4))
-                self.rhythm_vector.append(round(flight, 4))
-
-                # --- Bigram timing ---
-                if self._prev_char is not None:
-                    bigram_key = self._prev_char + char_lower
-                    if bigram_key in TARGET_BIGRAMS:
-                        self.bigrams.setdefault(bigram_key, []).append(round(flight, 4))
-
-        # Update state for next keypress
-        self._last_press_time = current_time
-        self._prev_char = char_lower
-
-        # Record press time for dwell computation
-        self._press_times[char_lower + str(current_time)] = current_time
+        self._prev_typed = char_lower
 
     def _on_key_release(self, key):
-        """Record key-release timestamp; compute dwell time."""
+        """Record a key-release event."""
         if not self.capturing:
             return
 
-        release_time = time.time()
+        release_time = _now() - self._t0
 
         try:
             char = key.char
@@ -201,35 +254,77 @@ class KeystrokeCapture:
         except AttributeError:
             return
 
-        char_lower = char.lower()
-
-        # Find the most recent unmatched press for this character
-        # Key in _press_times is "char + str(press_timestamp)"
-        candidates = [
-            (k, v) for k, v in self._press_times.items()
-            if k.startswith(char_lower)
-        ]
-        if candidates:
-            # Take the earliest unmatched press
-            candidates.sort(key=lambda x: x[1])
-            key_id, press_time = candidates[0]
-            del self._press_times[key_id]
-
-            dwell = release_time - press_time
-            if 0 < dwell <= self.max_interval:
-                self.dwell_times.append(round(dwell, 4))
+        n = self._n_events
+        if n < len(self._events):
+            self._events[n] = (release_time, False,
+                               _ASCII_LOWER.get(char) or char.lower())
+            self._n_events = n + 1
 
     def _finish_capture(self):
-        """Signal end of capture session."""
+        """
+        Signal end of capture session.
+
+        Runs on the pynput dispatcher thread, so it only flips state; the
+        summary is printed by capture_keystrokes() on the waiting thread.
+        """
         self.capturing = False
         self.capture_complete.set()
-        n_flight = len(self.flight_times)
-        n_dwell  = len(self.dwell_times)
-        n_bigram = sum(len(v) for v in self.bigrams.values())
-        print(f"\n  ✓ Captured {n_flight} flight times | "
-              f"{n_dwell} dwell times | "
-              f"{n_bigram} bigram samples across {len(self.bigrams)} bigrams.")
-        time.sleep(0.1)
+
+    # ------------------------------------------------------------------
+    # Post-capture processing
+    # ------------------------------------------------------------------
+
+    def _process_events(self) -> None:
+        """
+        Derive flight, dwell and bigram timings from the raw event log.
+
+        Called on the capturing thread after the listener has stopped.
+        Each metric is derived in its own pass over the press / release
+        streams rather than in one branchy per-event loop.
+        """
+        events = self._events[:self._n_events]
+        presses = [(ts, ch) for ts, is_press, ch in events if is_press]
+
+        # The ':q' terminator is always the final press; it is not timed
+        if [ch for _, ch in presses[-2:]] == [":", "q"]:
+            presses.pop()
+
+        press_ts = [ts for ts, _ in presses]
+        press_chars = [ch for _, ch in presses]
+
+        # --- Flight times and bigram timings (consecutive press pairs) ---
+        max_ns = self._max_interval_ns
+        append_flight = self.flight_times.append
+        bigrams = self.bigrams
+        for prev_char, char_lower, flight_ns in zip(
+            press_chars, press_chars[1:], map(operator.sub, press_ts[1:], press_ts)
+        ):
+            if flight_ns > max_ns:
+                continue
+            flight = round(flight_ns / _NS_PER_SECOND, 4)   # rounded once, shared below
+            append_flight(flight)
+
+            bigram_key = prev_char + char_lower
+            if bigram_key in TARGET_BIGRAMS:
+                bigrams.setdefault(bigram_key, []).append(flight)
+
+        # Per-bigram means, matching the scalar layout of the baseline's
+        # bigram_avg, so scoring does not average the lists again
+        self.bigram_avg = {k: math.fsum(v) / len(v) for k, v in bigrams.items()}
+
+        # --- Dwell times: match each release to the earliest unmatched press ---
+        # char → bounded FIFO of press timestamps
+        press_times = defaultdict(lambda: deque(maxlen=_MAX_PENDING_PRESSES))
+        append_dwell = self.dwell_times.append
+        for ts, is_press, char_lower in events:
+            if is_press:
+                press_times[char_lower].append(ts)
+                continue
+            pending = press_times.get(char_lower)
+            if pending:
+                dwell_ns = ts - pending.popleft()
+                if 0 < dwell_ns <= max_ns:
+                    append_dwell(round(dwell_ns / _NS_PER_SECOND, 4))
 
     @staticmethod
     def _empty_result() -> dict:
@@ -237,24 +332,47 @@ class KeystrokeCapture:
             "flight_times":  [],
             "dwell_times":   [],
             "bigrams":       {},
+            "bigram_avg":    {},
             "rhythm_vector": [],
             "chars":         "",
+            "n":             0,
         }
 
 
 # ---------------------------------------------------------------------------
-# Convenience module-level function
+# Convenience module-level functions
 # ---------------------------------------------------------------------------
 
+# Shared capture instance so every capture in a session reuses one listener.
+_shared_capture = None
+
+
 def capture_keystrokes(prompt_text: str) -> dict:
     """
     Capture multi-metric keystroke data.
 
     Returns:
-        dict with flight_times, dwell_times, bigrams, rhythm_vector, chars
+        dict with flight_times, dwell_times, bigrams, bigram_avg,
+        rhythm_vector, chars, n
     """
-    capture = KeystrokeCapture()
-    return capture.capture_keystrokes(prompt_text)
+    global _shared_capture
+    if _shared_capture is None:
+        _shared_capture = KeystrokeCapture()
+    return _shared_capture.capture_keystrokes(prompt_text)
+
+
+def preload_listener() -> None:
+    """Import the pynput keyboard backend ahead of the first capture."""
+    global _Listener
+    if _Listener is None:
+        from pynput.keyboard import Listener
+        _Listener = Listener
+
+
+def close_listener() -> None:
+    """Shut down the shared capture's keyboard listener, if one was started."""
+    if _shared_capture is not None:
+        _shared_capture.close()
 
 
 # Legacy shim so any old code calling capture_keystroke_intervals still works.
@@ -20,14 +20,20 @@ PRESENTATION ONLY changes vs v1:
   - clear screen on each menu refresh
   - professional ASCII header
 
-Authentication logic is 100% UNCHANGED.
+Authentication logic is unchanged from v1, except that a session whose
+rhythm vector overlaps the baseline's too little to compare is rejected
+as SUSPICIOUS with reason INSUFFICIENT_DATA (see risk_engine).
 """
 
 import os
+import queue
+from collections import namedtuple
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+import signal
 import time
 import threading
 
-from keystroke import capture_keystrokes
+from keystroke import capture_keystrokes, close_listener, preload_listener
 from trust_engine import TrustEngine
 import ui_console as ui
 import config
@@ -43,6 +49,50 @@ VERIFICATION_TEXT   = config.VERIFICATION_TEXT
 REVERIFICATION_TEXT = config.REVERIFICATION_TEXT
 RE_VERIFY_INTERVAL  = config.RE_VERIFY_INTERVAL
 
+_LOG_STOP = None       # sentinel telling the log writer thread to exit
+_EXIT     = object()   # returned by a menu handler to leave the main loop
+
+_WARMUP_TIMEOUT = 0.5   # max seconds the startup message waits for _warmup()
+_WAIT_SLICE     = 0.5   # longest uninterrupted wait between re-checks (Ctrl+C latency)
+_LOG_DRAIN_TIMEOUT = 2.0  # max seconds view_logs waits for queued events to be written
+
+def _reason_note(reason: str) -> str:
+    """Log suffix naming a RiskResult.reason, or "" when there is none."""
+    return f"  reason={reason}" if reason else ""
+
+
+# One session-monitor re-check, queued as-is and formatted by the log writer
+_ReCheckRecord = namedtuple("_ReCheckRecord", "n status risk threshold interval ts reason")
+
+
+# ---------------------------------------------------------------------------
+# Static screen text — built once at import, printed as-is on every redraw
+# ---------------------------------------------------------------------------
+
+_MENU_BODY = "\n".join((
+    "",
+    "  [1]  Initialize Behavioral Profile",
+    "  [2]  Activate Continuous Authentication",
+    "  [3]  Session Monitor  (continuous re-verification)",
+    "  [4]  View Security Logs",
+    "  [5]  View Trust Engine Metrics",
+    "  [6]  Exit System",
+    "",
+    f"  {'─' * 58}",
+))
+
+_LOCK_BAR   = "!" * 60
+_LOCK_LINES = (
+    _LOCK_BAR,
+    "  SESSION LOCKED",
+    "  Typing behavior deviated significantly from your baseline.",
+    "  Access has been REVOKED for security.",
+    "  Please re-register or contact your system administrator.",
+    _LOCK_BAR,
+)
+# Colour codes applied once here rather than on every lock
+_LOCK_BANNER = tuple(map(ui.alert_line, _LOCK_LINES))
+
 
 # ---------------------------------------------------------------------------
 # Core authentication class
@@ -57,26 +107,49 @@ class ZeroTrustAuthSystem:
     def __init__(self):
         self.trust_engine      = TrustEngine()
         self._session_active   = False
+        self._wake_event       = threading.Event()  # ends the re-verification wait early
+        self._wait_interrupted = False
         # Note: _session_lock removed — session_active is only mutated on the
         # main thread; the Lock was unused dead code (Phase 0 / P6).
         self._last_assessment  = None   # held in memory for diagnostics display
 
+        # Security events are queued and written by a background thread so
+        # file I/O never sits between a risk decision and its verdict.
+        self._log_q      = queue.Queue(maxsize=config.LOG_QUEUE_SIZE)
+        self._log_thread = threading.Thread(
+            target=self._log_writer, name="security-log-writer", daemon=True
+        )
+        self._log_thread.start()
+
+        # Loads the baseline while the user is still typing
+        self._io_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="baseline-io")
+
+        # Current re-verification interval (adapted per session, seconds)
+        self._interval = RE_VERIFY_INTERVAL
+
+        # Menu handlers indexed by option number (slot 0 unused)
+        self._dispatch = (
+            None,
+            self.register_baseline,
+            self.login_and_verify,
+            self.session_monitor,
+            self.view_logs,
+            self.view_diagnostics,
+            self._exit,
+        )
+
+        # Optional assessment memo (config.ASSESSMENT_CACHE_ENABLED)
+        self._assessment_cache  = {}
+        self._assessment_hits   = 0
+        self._assessment_misses = 0
+
     # ------------------------------------------------------------------
     # Menu
     # ------------------------------------------------------------------
 
     def display_menu(self) -> None:
         ui.clear_screen()
-        ui.print_header()
-        ui.print_info("Main Menu – Select an operation:")
-        print()
-        print("  [1]  Initialize Behavioral Profile")
-        print("  [2]  Activate Continuous Authentication")
-        print("  [3]  Session Monitor  (continuous re-verification)")
-        print("  [4]  View Security Logs")
-        print("  [5]  View Trust Engine Metrics")
-        print("  [6]  Exit System")
-        print(f"\n  {'─' * 58}")
+        ui.emit(ui.header(), ui.info_line("Main Menu – Select an operation:"), _MENU_BODY)
 
     # ------------------------------------------------------------------
     # Option 1 – Register Baseline
@@ -93,9 +166,9 @@ class ZeroTrustAuthSystem:
         try:
             data = capture_keystrokes(REGISTRATION_TEXT)
 
-            if not data["flight_times"]:
+            if data["n"] == 0:
                 ui.print_alert("No keystroke data captured. Please try again.")
-                ui.log_event("WARN ", "Baseline registration failed – no data captured")
+                self._log("WARN ", "Baseline registration failed – no data captured")
                 return
 
             baseline = self.trust_engine.create_baseline(data)
@@ -112,62 +185,64 @@ class ZeroTrustAuthSystem:
             ui.print_label("Rhythm vector length :", str(len(baseline["rhythm_vector"])))
             ui.print_label("Adaptive threshold   :", f"{threshold:.4f}")
 
-            ui.log_event("INFO ", "Baseline behavioral profile registered successfully")
+            self._log("INFO ", "Baseline behavioral profile registered successfully")
 
         except ValueError as e:
             ui.print_alert(f"Registration failed: {e}")
-            ui.log_event("WARN ", f"Baseline registration error: {e}")
-        except Exception as e:
+            self._log("WARN ", f"Baseline registration error: {e}")
+        except (OSError, KeyError) as e:
             ui.print_alert(f"Unexpected error: {e}")
-            ui.log_event("WARN ", f"Unexpected registration error: {e}")
+            self._log("WARN ", f"Unexpected registration error: {e}")
 
     # ------------------------------------------------------------------
     # Option 2 – One-shot Authentication
     # ------------------------------------------------------------------
 
-    def login_and_verify(self) -> dict | None:
+    def login_and_verify(self) -> risk_engine.RiskResult | None:
         ui.clear_screen()
         ui.print_header()
         ui.section_banner("[ 2 ]  ACTIVATE CONTINUOUS AUTHENTICATION")
 
         try:
-            baseline = self.trust_engine.load_baseline()
+            baseline_future = self._prefetch_baseline()
         except FileNotFoundError as e:
             ui.print_alert(str(e))
-            ui.log_event("WARN ", "Authentication attempted without baseline profile")
+            self._log("WARN ", "Authentication attempted without baseline profile")
             return None
 
         ui.print_info("Identity verification in progress...")
 
         try:
             data = capture_keystrokes(VERIFICATION_TEXT)
-            if not data["flight_times"]:
+            baseline = baseline_future.result()
+            if data["n"] == 0:
                 ui.print_alert("No keystroke data captured. Please try again.")
                 return None
 
-            # --- Core auth call (UNCHANGED) ---
-            assessment = self.trust_engine.compute_risk(data, baseline)
+            # --- Core auth call ---
+            assessment = self._assess(data, baseline)
             self._last_assessment = assessment
 
             # --- UI: colored table + risk bar ---
             ui.print_risk_table(assessment, "AUTHENTICATION RESULT")
 
-            if assessment["status"] == "TRUSTED":
+            if assessment.status == "TRUSTED":
                 ui.print_trusted("Access GRANTED. Welcome.")
-                ui.log_event("INFO ", f"Session TRUSTED  | risk={assessment['risk_score']:.4f}  threshold={assessment['threshold']:.4f}")
+                self._log("INFO ", f"Session TRUSTED  | risk={assessment.risk_score:.4f}  threshold={assessment.threshold:.4f}")
             else:
                 ui.print_alert("Access DENIED. Behavioral anomaly detected.")
                 ui.print_alert("Session Locked. Please re-register or contact admin.")
-                ui.log_event("ALERT", f"Session SUSPICIOUS | risk={assessment['risk_score']:.4f}  threshold={assessment['threshold']:.4f}")
+                self._log("ALERT", f"Session SUSPICIOUS | risk={assessment.risk_score:.4f}  threshold={assessment.threshold:.4f}"
+                                  f"{_reason_note(assessment.reason)}")
 
             return assessment
 
         except ValueError as e:
             ui.print_alert(f"Verification error: {e}")
-            ui.log_event("WARN ", f"Verification error: {e}")
-        except Exception as e:
+            self._log("WARN ", f"Verification error: {e}")
+        except (OSError, KeyError) as e:
             ui.print_alert(f"Unexpected error: {e}")
-            ui.log_event("WARN ", f"Unexpected verification error: {e}")
+            self._log("WARN ", f"Unexpected verification error: {e}")
 
         return None
 
@@ -182,45 +257,57 @@ class ZeroTrustAuthSystem:
 
         # ---- Step 1: Load baseline ----
         try:
-            baseline = self.trust_engine.load_baseline()
+            baseline_future = self._prefetch_baseline()
         except FileNotFoundError as e:
             ui.print_alert(str(e))
-            ui.log_event("WARN ", "Session Monitor started without baseline profile")
+            self._log("WARN ", "Session Monitor started without baseline profile")
             return
 
         # ---- Step 2: Initial login ----
         ui.print_info("Step 1 of 2 – Initial identity verification...")
         data = capture_keystrokes(VERIFICATION_TEXT)
+        try:
+            baseline = baseline_future.result()
+        except ValueError as e:
+            ui.print_alert(f"Baseline error: {e}")
+            self._log("WARN ", f"Session Monitor aborted – invalid baseline: {e}")
+            return
+        except OSError as e:
+            ui.print_alert(f"Could not load baseline: {e}")
+            self._log("WARN ", f"Session Monitor aborted – baseline unreadable: {e}")
+            return
 
-        if not data["flight_times"]:
+        if data["n"] == 0:
             ui.print_alert("No keystroke data. Aborting session.")
-            ui.log_event("WARN ", "Session Monitor aborted – no keystroke data at login")
+            self._log("WARN ", "Session Monitor aborted – no keystroke data at login")
             return
 
-        assessment = self.trust_engine.compute_risk(data, baseline)
+        assessment = self._assess(data, baseline)
         self._last_assessment = assessment
         ui.print_risk_table(assessment, "INITIAL VERIFICATION")
 
-        if assessment["status"] != "TRUSTED":
+        if assessment.status != "TRUSTED":
             ui.print_alert("Initial verification FAILED. Session not started.")
-            ui.log_event("ALERT", f"Session Monitor initial verification FAILED | risk={assessment['risk_score']:.4f}")
+            self._log("ALERT", f"Session Monitor initial verification FAILED | risk={assessment.risk_score:.4f}"
+                              f"{_reason_note(assessment.reason)}")
             return
 
         ui.print_trusted("Initial verification passed. Session is now ACTIVE.")
-        ui.print_info(f"Re-verification every {RE_VERIFY_INTERVAL} seconds.")
+        ui.print_info(f"Re-verification every {RE_VERIFY_INTERVAL} seconds, "
+                      "adjusted to how closely you match your baseline.")
         ui.print_info("(Press Ctrl+C at any time to end the session.)\n")
-        ui.log_event("INFO ", "Session Monitor started – initial verification TRUSTED")
+        self._log("INFO ", "Session Monitor started – initial verification TRUSTED")
 
         # ---- Step 3: Continuous re-verification loop ----
         self._session_active = True
+        self._interval = RE_VERIFY_INTERVAL
         recheck_count = 0
 
         while self._session_active:
-            # Cosmetic countdown display (no logic change)
-            completed = ui.countdown_display(RE_VERIFY_INTERVAL, "Re-verification")
+            completed = self._wait_for_recheck(self._interval)
             if not completed:
                 self._session_active = False
-                ui.log_event("INFO ", "Session ended by user (Ctrl+C)")
+                self._log("INFO ", "Session ended by user (Ctrl+C)")
                 break
 
             if not self._session_active:
@@ -232,54 +319,123 @@ class ZeroTrustAuthSystem:
 
             data = capture_keystrokes(REVERIFICATION_TEXT)
 
-            if not data["flight_times"]:
+            if data["n"] == 0:
                 ui.print_warning("No typing data received. Locking session for safety.")
-                ui.log_event("LOCK ", f"Re-check #{recheck_count} – no data received, session locked")
+                self._log("LOCK ", f"Re-check #{recheck_count} – no data received, session locked")
                 self._lock_session()
                 break
 
-            # --- Core auth call (UNCHANGED) ---
-            check = self.trust_engine.compute_risk(data, baseline)
+            # --- Core auth call ---
+            check = self._assess(data, baseline)
             self._last_assessment = check
             ui.print_risk_table(check, f"RE-VERIFICATION #{recheck_count} RESULT")
 
-            if check["status"] == "TRUSTED":
+            trusted = check.status == "TRUSTED"
+            if trusted:
+                self._interval = self._next_interval(check)
+            self._enqueue_log(_ReCheckRecord(
+                recheck_count, check.status, check.risk_score,
+                check.threshold, self._interval, time.time(), check.reason,
+            ))
+
+            if trusted:
                 ui.print_trusted(f"Re-verification #{recheck_count} passed. Session continues.")
-                ui.log_event("INFO ", f"Re-check #{recheck_count} TRUSTED | risk={check['risk_score']:.4f}")
+                ui.print_info(f"Next re-verification in {self._interval} seconds.")
             else:
                 ui.print_alert(f"Behavioral deviation detected during re-check #{recheck_count}!")
-                ui.log_event("ALERT", f"Re-check #{recheck_count} SUSPICIOUS | risk={check['risk_score']:.4f}")
                 self._lock_session()
                 break
 
         if self._session_active:
             ui.print_info("Session ended normally.")
             self._session_active = False
-            ui.log_event("INFO ", "Session Monitor ended normally")
+            self._log("INFO ", "Session Monitor ended normally")
+
+    def _next_interval(self, check: risk_engine.RiskResult) -> int:
+        """
+        Adapt the re-verification interval to a TRUSTED check's margin.
+
+        A check well under threshold stretches the interval by
+        RE_VERIFY_BACKOFF (up to RE_VERIFY_MAX_INTERVAL); one that only just
+        passed shortens it (down to RE_VERIFY_MIN_INTERVAL).
+
+        Args:
+            check : RiskResult of the re-check that just passed
+
+        Returns:
+            Seconds to wait before the next re-check
+        """
+        threshold = check.threshold
+        if threshold <= 0:
+            return self._interval
+        margin = (threshold - check.risk_score) / threshold
+        if margin > config.RE_VERIFY_CONFIDENT_MARGIN:
+            return round(min(self._interval * config.RE_VERIFY_BACKOFF,
+                             config.RE_VERIFY_MAX_INTERVAL))
+        if margin < config.RE_VERIFY_MARGINAL_MARGIN:
+            return round(max(self._interval / config.RE_VERIFY_BACKOFF,
+                             config.RE_VERIFY_MIN_INTERVAL))
+        return self._interval
+
+    def _wait_for_recheck(self, seconds: int) -> bool:
+        """
+        Block until the next re-verification is due.
+
+        The main thread waits on an Event in _WAIT_SLICE steps; the
+        countdown is redrawn by a daemon thread. For the duration of the
+        wait, Ctrl+C is routed to a SIGINT handler that sets the event,
+        so the session ends within one slice on every platform. On a terminal,
+        Enter makes the countdown set the event itself, starting the
+        re-check early.
+
+        Returns:
+            True if the interval elapsed, False if Ctrl+C was pressed
+        """
+        self._wake_event.clear()
+        self._wait_interrupted = False
+
+        def _on_sigint(signum, frame):
+            self._wait_interrupted = True
+            self._wake_event.set()
+
+        previous_handler = signal.signal(signal.SIGINT, _on_sigint)
+        ticker = threading.Thread(
+            target=ui.countdown_display,
+            args=(seconds, "Re-verification", self._wake_event, True),
+            daemon=True,
+        )
+        try:
+            ticker.start()
+            # Waited in short slices: on Windows a single long wait cannot
+            # be interrupted, so the SIGINT handler would not run until
+            # the whole interval had passed.
+            deadline = time.monotonic() + seconds
+            while (remaining := deadline - time.monotonic()) > 0:
+                if self._wake_event.wait(min(_WAIT_SLICE, remaining)):
+                    break
+        finally:
+            signal.signal(signal.SIGINT, previous_handler)
+            self._wake_event.set()          # stop the countdown redraw
+            ticker.join(timeout=1.0)
 
-    def _countdown(self, seconds: int) -> None:
-        """Internal countdown (delegates to ui_console for cosmetics)."""
-        completed = ui.countdown_display(seconds, "Re-verification")
-        if not completed:
-            self._session_active = False
+        if self._wait_interrupted:
+            ui.print_warning("Session ended by user (Ctrl+C).")
+            return False
+        return True
 
     def _lock_session(self) -> None:
         """Immediately terminate the session."""
         self._session_active = False
         # Use ui_console exclusively — no bare colorama imports in orchestrator.
-        ui.print_alert("!" * 60)
-        ui.print_alert("  SESSION LOCKED")
-        ui.print_alert("  Typing behavior deviated significantly from your baseline.")
-        ui.print_alert("  Access has been REVOKED for security.")
-        ui.print_alert("  Please re-register or contact your system administrator.")
-        ui.print_alert("!" * 60)
-        ui.log_event("LOCK", "SESSION LOCKED - behavioral anomaly exceeded threshold")
+        ui.emit(*_LOCK_BANNER)
+        self._log("LOCK", "SESSION LOCKED - behavioral anomaly exceeded threshold")
 
     # ------------------------------------------------------------------
     # Option 4 – View Security Logs
     # ------------------------------------------------------------------
 
     def view_logs(self) -> None:
+        self._drain_log(_LOG_DRAIN_TIMEOUT)   # show every event queued so far
         ui.clear_screen()
         ui.print_header()
         ui.view_security_logs(max_lines=50)
@@ -293,6 +449,10 @@ class ZeroTrustAuthSystem:
         ui.print_header()
         # Compute threshold here (in the auth layer) and pass to ui — keeps
         # ui_console free of risk_engine imports (SPEC interface contract).
+        # Snapshot the cache counters before this view loads the baseline,
+        # so the figures describe the session rather than the screen itself.
+        hits, misses = self.trust_engine.cache_hits, self.trust_engine.cache_misses
+        baseline  = None
         threshold = None
         try:
             baseline  = self.trust_engine.load_baseline()
@@ -301,7 +461,33 @@ class ZeroTrustAuthSystem:
             )
         except FileNotFoundError:
             pass
-        ui.view_trust_diagnostics(self.trust_engine, self._last_assessment, threshold)
+        hit_rate = hits / (hits + misses) if hits + misses else 0.0
+        session_stats = {
+            "Baseline cache hits  :": str(hits),
+            "Baseline cache misses:": str(misses),
+            "Baseline cache hit % :": f"{hit_rate * 100:.1f}",
+            "Re-verify interval   :": f"{self._interval} s",
+            "Assessment cache     :": (
+                f"{self._assessment_hits} hits / {self._assessment_misses} misses"
+                if config.ASSESSMENT_CACHE_ENABLED else "disabled"
+            ),
+        }
+        ui.view_trust_diagnostics(
+            baseline, self._last_assessment, threshold, session_stats
+        )
+
+    # ------------------------------------------------------------------
+    # Option 6 – Exit
+    # ------------------------------------------------------------------
+
+    def _exit(self) -> object:
+        ui.clear_screen()
+        ui.print_header()
+        ui.print_info("Exiting Zero Trust Security Console.")
+        ui.print_info("Stay secure. Trust nothing. Verify everything.")
+        self._log("EXIT ", "Zero Trust Authentication System shut down")
+        print()
+        return _EXIT
 
     # ------------------------------------------------------------------
     # Main loop
@@ -309,32 +495,23 @@ class ZeroTrustAuthSystem:
 
     def run(self) -> None:
         """Application main loop."""
-        ui.log_event("BOOT ", "Zero Trust Authentication System v2.0 started")
+        try:
+            self._run_menu()
+        finally:
+            self._io_pool.shutdown(wait=False)
+            self._stop_logging()
+
+    def _run_menu(self) -> None:
+        """Menu dispatch loop; run() wraps it so the log writer is always flushed."""
+        self._log("BOOT ", "Zero Trust Authentication System v2.0 started")
         ui.print_info("Initializing Zero Trust Security Console...")
-        time.sleep(0.5)
+        wait((self._io_pool.submit(self._warmup),), timeout=_WARMUP_TIMEOUT)
 
         while True:
             try:
                 self.display_menu()
                 choice = self._get_menu_choice()
-
-                if   choice == "1":
-                    self.register_baseline()
-                elif choice == "2":
-                    self.login_and_verify()
-                elif choice == "3":
-                    self.session_monitor()
-                elif choice == "4":
-                    self.view_logs()
-                elif choice == "5":
-                    self.view_diagnostics()
-                elif choice == "6":
-                    ui.clear_screen()
-                    ui.print_header()
-                    ui.print_info("Exiting Zero Trust Security Console.")
-                    ui.print_info("Stay secure. Trust nothing. Verify everything.")
-                    ui.log_event("EXIT ", "Zero Trust Authentication System shut down")
-                    print()
+                if self._dispatch[choice]() is _EXIT:
                     break
 
                 self._safe_pause()
@@ -342,26 +519,172 @@ class ZeroTrustAuthSystem:
             except KeyboardInterrupt:
                 print("\n")
                 ui.print_warning("Keyboard interrupt received. Exiting...")
-                ui.log_event("EXIT ", "System exited via KeyboardInterrupt")
+                self._log("EXIT ", "System exited via KeyboardInterrupt")
                 break
-            except Exception as e:
+            except (OSError, ValueError, KeyError) as e:
+                # Bad or unreadable baseline / log files; anything else is a
+                # bug and propagates to main().
                 ui.print_alert(f"Unexpected error: {e}")
-                ui.log_event("WARN ", f"Unhandled exception in main loop: {e}")
+                self._log("WARN ", f"Unhandled exception in main loop: {e}")
                 self._safe_pause()
 
     # ------------------------------------------------------------------
     # Utilities
     # ------------------------------------------------------------------
 
-    def _get_menu_choice(self) -> str:
+    def _log(self, level: str, message: str) -> None:
+        """Queue a security event for the background log writer."""
+        self._enqueue_log((level, message, time.time()))
+
+    def _enqueue_log(self, item: tuple) -> None:
+        """Queue a (level, message, ts) tuple or a _ReCheckRecord."""
+        try:
+            self._log_q.put_nowait(item)
+        except queue.Full:
+            # never drop a security event
+            ui.write_log_entries([self._format_log_item(item)])
+
+    @staticmethod
+    def _format_log_item(item: tuple) -> str:
+        """Render one queued log item as a security_log.txt line."""
+        if type(item) is _ReCheckRecord:
+            if item.status == "TRUSTED":
+                return ui.format_log_entry(
+                    "INFO ",
+                    f"Re-check #{item.n} TRUSTED | risk={item.risk:.4f}  "
+                    f"threshold={item.threshold:.4f}  next={item.interval}s",
+                    item.ts,
+                )
+            return ui.format_log_entry(
+                "ALERT",
+                f"Re-check #{item.n} {item.status} | risk={item.risk:.4f}  "
+                f"threshold={item.threshold:.4f}{_reason_note(item.reason)}",
+                item.ts,
+            )
+        return ui.format_log_entry(*item)
+
+    def _log_writer(self) -> None:
+        """
+        Background thread: drain queued events and append them in batches.
+
+        Waits up to LOG_BATCH_WINDOW after the first event for more to
+        arrive, then writes the whole batch with one file write.
+        """
+        while True:
+            batch = [self._log_q.get()]
+            deadline = time.monotonic() + config.LOG_BATCH_WINDOW
+            while batch[-1] is not _LOG_STOP and len(batch) < config.LOG_BATCH_MAX:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._log_q.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            entries = [self._format_log_item(item) for item in batch if item is not _LOG_STOP]
+            if entries:
+                ui.write_log_entries(entries)
+            for _ in batch:
+                self._log_q.task_done()
+            if batch[-1] is _LOG_STOP:
+                return
+
+    def _drain_log(self, timeout: float) -> bool:
+        """
+        Wait until every queued event has been written, like Queue.join()
+        but bounded: gives up after timeout seconds, or at once if the log
+        writer thread is no longer running.
+
+        Returns:
+            True if the queue was fully drained
+        """
+        q = self._log_q
+        deadline = time.monotonic() + timeout
+        with q.all_tasks_done:
+            while q.unfinished_tasks:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not self._log_thread.is_alive():
+                    return False
+                q.all_tasks_done.wait(min(remaining, _WAIT_SLICE))
+        return True
+
+    def _stop_logging(self) -> None:
+        """Flush queued events and stop the log writer thread."""
+        self._log_q.put(_LOG_STOP)
+        self._log_thread.join(timeout=1.0)
+
+    def _assess(self, data: dict, baseline: dict) -> risk_engine.RiskResult:
+        """
+        Score a capture against the baseline via TrustEngine.compute_risk().
+
+        With ASSESSMENT_CACHE_ENABLED, an identical capture against the same
+        baseline (by its "_id") returns the earlier assessment.
+        """
+        if not config.ASSESSMENT_CACHE_ENABLED:
+            return self.trust_engine.compute_risk(data, baseline)
+
+        key = (
+            baseline.get("_id"),
+            tuple(data["flight_times"]),
+            tuple(data["dwell_times"]),
+            data["chars"],
+        )
+        cached = self._assessment_cache.get(key)
+        if cached is not None:
+            self._assessment_hits += 1
+            return cached
+
+        self._assessment_misses += 1
+        assessment = self.trust_engine.compute_risk(data, baseline)
+        if len(self._assessment_cache) >= config.ASSESSMENT_CACHE_SIZE:
+            del self._assessment_cache[next(iter(self._assessment_cache))]
+        self._assessment_cache[key] = assessment
+        return assessment
+
+    def _warmup(self) -> None:
+        """
+        Startup work run on the I/O worker: parse the baseline into the
+        cache and import the keyboard backend, so the first capture and
+        verification pay for neither. Runs on the same single worker as
+        _prefetch_baseline(), so the two never overlap.
+        """
+        if os.path.exists(self.trust_engine.baseline_file):
+            try:
+                self.trust_engine.load_baseline()
+            except (OSError, ValueError):
+                pass   # reported when the user actually verifies
+        try:
+            preload_listener()
+        except ImportError:
+            pass       # reported by the first capture
+
+    def _prefetch_baseline(self) -> Future:
+        """
+        Start loading the baseline on the I/O worker.
+
+        The existence check runs here, so a missing profile is reported
+        before the user is asked to type; the parse overlaps the capture.
+
+        Returns:
+            Future resolving to the baseline dict (cached by TrustEngine)
+
+        Raises:
+            FileNotFoundError: If no baseline has been registered
+        """
+        self.trust_engine.require_baseline()
+        return self._io_pool.submit(self.trust_engine.load_baseline)
+
+    def _get_menu_choice(self) -> int:
+        """Prompt until a valid option is entered; returns it as 1-6."""
         while True:
             try:
-                choice = input("\n  Enter your choice (1-6): ").strip()
-                if choice in ("1", "2", "3", "4", "5", "6"):
-                    return choice
+                choice = ui.read_choice("\n  Enter your choice (1-6): ")
+                if len(choice) == 1 and "1" <= choice <= "6":
+                    return ord(choice) - 48
                 ui.print_warning("Invalid choice. Please enter 1 through 6.")
             except (EOFError, KeyboardInterrupt):
-                return "6"
+                return 6
 
     def _safe_pause(self) -> None:
         try:
@@ -380,6 +703,9 @@ def main() -> None:
     except Exception as e:
         ui.print_alert(f"Fatal system error: {e}")
         ui.log_event("WARN ", f"Fatal system error: {e}")
+        raise
+    finally:
+        close_listener()
 
 
 if __name__ == "__main__":
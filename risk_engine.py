@@ -7,13 +7,15 @@ Contains all statistical math for behavioral biometric analysis:
   2. Cosine similarity   – directional rhythm pattern match
   3. Bigram deviation    – per-bigram average timing shift
   4. Multi-factor risk   – weighted combination of all signals
+                          (single session or a batch against one baseline)
   5. Dynamic threshold   – adapts to user typing consistency
 
 Weights are module-level constants and can be tuned freely.
 """
 
 import math
-import statistics
+import operator
+from typing import NamedTuple
 
 import config
 
@@ -28,9 +30,35 @@ W3          = config.W3
 W4          = config.W4
 THRESHOLD_K = config.THRESHOLD_K
 MIN_SAMPLES = config.MIN_SAMPLES
+MIN_RHYTHM_OVERLAP = config.MIN_RHYTHM_OVERLAP
+
+# RiskResult.reason when the rhythm vectors overlap too little to compare
+INSUFFICIENT_DATA = "INSUFFICIENT_DATA"
 _FLOOR_STD  = config.FLOOR_STD
 
 
+# ---------------------------------------------------------------------------
+# Result type
+# ---------------------------------------------------------------------------
+
+class RiskResult(NamedTuple):
+    """
+    Outcome of compute_multifactor_risk().
+
+    Read fields as attributes (result.status); use _asdict() where a
+    mapping is needed.
+    """
+    flight_dev:  float
+    dwell_dev:   float
+    bigram_dev:  float
+    vector_dist: float
+    cosine_sim:  float
+    risk_score:  float
+    threshold:   float
+    status:      str     # "TRUSTED" | "SUSPICIOUS"
+    reason:      str = ""  # why SUSPICIOUS regardless of score, e.g. INSUFFICIENT_DATA
+
+
 # ---------------------------------------------------------------------------
 # Vector math utilities
 # ---------------------------------------------------------------------------
@@ -39,9 +67,21 @@ def _align_vectors(v1: list, v2: list) -> tuple:
     """
     Align two vectors to the same length by truncating the longer one.
     Returns (v1_aligned, v2_aligned).
+
+    Only the longer vector is copied; a vector that already has the
+    common length is returned as-is (callers never mutate the result).
     """
-    min_len = min(len(v1), len(v2))
-    return v1[:min_len], v2[:min_len]
+    n1, n2 = len(v1), len(v2)
+    if n1 > n2:
+        return v1[:n2], v2
+    if n2 > n1:
+        return v1, v2[:n1]
+    return v1, v2
+
+
+def _mean(values: list) -> float:
+    """Arithmetic mean of a non-empty float list (fsum keeps it accurate)."""
+    return math.fsum(values) / len(values)
 
 
 def euclidean_distance(v1: list, v2: list) -> float:
@@ -64,19 +104,20 @@ def euclidean_distance(v1: list, v2: list) -> float:
     if not a:
         return 0.0
 
-    sq_sum = sum((x - y) ** 2 for x, y in zip(a, b))
-    return math.sqrt(sq_sum)
+    return math.dist(a, b)
 
 
-def cosine_similarity(v1: list, v2: list) -> float:
+def cosine_similarity(v1: list, v2: list, norm_v1: float | None = None) -> float:
     """
     Compute cosine similarity between two timing vectors.
 
     similarity = dot(v1, v2) / (||v1|| * ||v2||)
 
     Args:
-        v1: Baseline rhythm vector
-        v2: Current session rhythm vector
+        v1:      Baseline rhythm vector
+        v2:      Current session rhythm vector
+        norm_v1: Precomputed ||v1|| (the baseline's "_rhythm_norm");
+                 ignored when alignment truncates v1
 
     Returns:
         Similarity in [-1, 1]; 1 = perfectly aligned patterns
@@ -88,9 +129,14 @@ def cosine_similarity(v1: list, v2: list) -> float:
     if not a:
         return 1.0
 
-    dot = sum(x * y for x, y in zip(a, b))
-    norm_a = math.sqrt(sum(x ** 2 for x in a))
-    norm_b = math.sqrt(sum(y ** 2 for y in b))
+    norm_a = norm_v1 if norm_v1 is not None and len(a) == len(v1) else math.hypot(*a)
+    return _cosine_aligned(a, b, norm_a)
+
+
+def _cosine_aligned(a: list, b: list, norm_a: float) -> float:
+    """Cosine similarity of two equal-length, non-empty vectors, given ||a||."""
+    dot = sum(map(operator.mul, a, b))
+    norm_b = math.hypot(*b)
 
     if norm_a == 0 or norm_b == 0:
         return 1.0 if norm_a == norm_b else 0.0
@@ -98,6 +144,24 @@ def cosine_similarity(v1: list, v2: list) -> float:
     return dot / (norm_a * norm_b)
 
 
+def _rhythm_metrics(v1: list, v2: list, norm_v1: float | None = None) -> tuple:
+    """
+    rhythm_vector_distance() and cosine_similarity() from a single alignment.
+
+    Returns:
+        (normalised distance, cosine similarity)
+    """
+    if not v1 or not v2:
+        return 0.0, 1.0
+
+    a, b = _align_vectors(v1, v2)
+    if not a:
+        return 0.0, 1.0
+
+    norm_a = norm_v1 if norm_v1 is not None and len(a) == len(v1) else math.hypot(*a)
+    return math.dist(a, b) / math.sqrt(len(a)), _cosine_aligned(a, b, norm_a)
+
+
 # ---------------------------------------------------------------------------
 # Individual signal deviation functions
 # ---------------------------------------------------------------------------
@@ -115,7 +179,7 @@ def flight_deviation(baseline_avg: float, current_times: list) -> float:
     """
     if not current_times:
         return 0.0
-    current_avg = statistics.mean(current_times)
+    current_avg = _mean(current_times)
     return abs(current_avg - baseline_avg)
 
 
@@ -132,7 +196,7 @@ def dwell_deviation(baseline_avg: float, current_times: list) -> float:
     """
     if not current_times or baseline_avg == 0.0:
         return 0.0
-    current_avg = statistics.mean(current_times)
+    current_avg = _mean(current_times)
     return abs(current_avg - baseline_avg)
 
 
@@ -152,20 +216,32 @@ def bigram_deviation(baseline_bigrams: dict, current_bigrams: dict) -> float:
     Returns:
         Mean bigram deviation (seconds); 0 if no shared bigrams
     """
-    shared = set(baseline_bigrams.keys()) & set(current_bigrams.keys())
-    if not shared:
-        return 0.0
-
+    # One dict probe per current bigram instead of building two key sets
     deviations = []
-    for bigram in shared:
-        b_avg = baseline_bigrams[bigram]  # scalar saved during registration
-        c_times = current_bigrams[bigram]
-        if not c_times:
+    for bigram, c_times in current_bigrams.items():
+        b_avg = baseline_bigrams.get(bigram)  # scalar saved during registration
+        if b_avg is None or not c_times:
             continue
-        c_avg = statistics.mean(c_times)
-        deviations.append(abs(b_avg - c_avg))
+        deviations.append(abs(b_avg - _mean(c_times)))
+
+    return _mean(deviations) if deviations else 0.0
 
-    return statistics.mean(deviations) if deviations else 0.0
+
+def _bigram_avg_deviation(baseline_bigrams: dict, current_avg: dict) -> float:
+    """
+    bigram_deviation() for a session whose per-bigram means are already
+    computed (the "bigram_avg" field of a capture result).
+
+    Args:
+        baseline_bigrams: {"co": 0.19, ...}  (averaged values from registration)
+        current_avg:      {"co": 0.195, ...} (averaged values from capture)
+    """
+    deviations = [
+        abs(b_avg - c_avg)
+        for bigram, c_avg in current_avg.items()
+        if (b_avg := baseline_bigrams.get(bigram)) is not None
+    ]
+    return _mean(deviations) if deviations else 0.0
 
 
 def rhythm_vector_distance(baseline_vector: list, current_vector: list) -> float:
@@ -200,7 +276,7 @@ def rhythm_vector_distance(baseline_vector: list, current_vector: list) -> float
 def compute_multifactor_risk(
     baseline: dict,
     current_data: dict,
-) -> dict:
+) -> RiskResult:
     """
     Compute the weighted multi-factor risk score.
 
@@ -212,62 +288,106 @@ def compute_multifactor_risk(
         current_data: Dict returned by keystroke.capture_keystrokes()
 
     Returns:
-        dict with individual component scores and total risk:
-        {
-            "flight_dev":    float,
-            "dwell_dev":     float,
-            "bigram_dev":    float,
-            "vector_dist":   float,
-            "cosine_sim":    float,
-            "risk_score":    float,   # weighted total
-            "threshold":     float,
-            "status":        str,     # "TRUSTED" | "SUSPICIOUS"
-        }
+        RiskResult with the individual component scores and total risk:
+            flight_dev, dwell_dev, bigram_dev, vector_dist, cosine_sim,
+            risk_score (weighted total), threshold,
+            status ("TRUSTED" | "SUSPICIOUS"),
+            reason ("" or INSUFFICIENT_DATA; vector_dist and cosine_sim
+            are then nan)
     """
-    # ---- Extract baseline values ----
-    b_flight_avg  = baseline.get("flight_avg", 0.0)
-    b_flight_std  = baseline.get("flight_std", 0.05)
-    b_dwell_avg   = baseline.get("dwell_avg",  0.0)
-    b_bigrams     = baseline.get("bigram_avg", {})
-    b_vector      = baseline.get("rhythm_vector", [])
+    return _score_session(_baseline_terms(baseline), current_data)
+
+
+def compute_multifactor_risk_batch(
+    baseline: dict,
+    sessions: list,
+) -> list:
+    """
+    Score many captured sessions against one baseline.
+
+    Equivalent to calling compute_multifactor_risk() per session, but the
+    baseline values and the dynamic threshold are extracted once. Meant
+    for offline re-scoring (threshold sweeps, replaying stored captures).
+
+    Args:
+        baseline: Profile dict loaded from baseline_profile.json
+        sessions: Dicts returned by keystroke.capture_keystrokes()
+
+    Returns:
+        list[RiskResult], one per session, in input order
+    """
+    terms = _baseline_terms(baseline)
+    return [_score_session(terms, current_data) for current_data in sessions]
+
+
+def _baseline_terms(baseline: dict) -> tuple:
+    """
+    The baseline values compute_multifactor_risk() needs, in the order
+    _score_session() unpacks them.
+    """
+    b_flight_std = baseline.get("flight_std", 0.05)
+    return (
+        baseline.get("flight_avg", 0.0),
+        baseline.get("dwell_avg",  0.0),
+        baseline.get("bigram_avg", {}),
+        baseline.get("rhythm_vector", []),
+        baseline.get("_rhythm_norm"),            # set by trust_engine at load
+        dynamic_threshold(b_flight_std),
+    )
+
+
+def _score_session(terms: tuple, current_data: dict) -> RiskResult:
+    """Score one capture against the output of _baseline_terms()."""
+    # ---- Baseline values ----
+    b_flight_avg, b_dwell_avg, b_bigrams, b_vector, b_norm, threshold = terms
 
     # ---- Extract current session values ----
     c_flights  = current_data.get("flight_times", [])
     c_dwells   = current_data.get("dwell_times",  [])
     c_bigrams  = current_data.get("bigrams", {})
+    c_bg_avg   = current_data.get("bigram_avg")   # per-bigram means, if captured
     c_vector   = current_data.get("rhythm_vector", [])
 
     # ---- Compute each component ----
     f_dev  = flight_deviation(b_flight_avg, c_flights)
     d_dev  = dwell_deviation(b_dwell_avg,  c_dwells)
-    bg_dev = bigram_deviation(b_bigrams,   c_bigrams)
-    v_dist = rhythm_vector_distance(b_vector, c_vector)
-    cos_sim = cosine_similarity(b_vector, c_vector)
+    bg_dev = (_bigram_avg_deviation(b_bigrams, c_bg_avg) if c_bg_avg is not None
+              else bigram_deviation(b_bigrams, c_bigrams))
+    # A rhythm vector that covers too little of the other cannot be scored
+    # meaningfully (e.g. ':q' pressed early); skip the vector maths, report
+    # those metrics as nan, and treat the session as SUSPICIOUS.
+    n_b, n_c = len(b_vector), len(c_vector)
+    too_short = bool(n_b and n_c) and min(n_b, n_c) < MIN_RHYTHM_OVERLAP * max(n_b, n_c)
+    if too_short:
+        v_dist, cos_sim = math.nan, math.nan
+    else:
+        v_dist, cos_sim = _rhythm_metrics(b_vector, c_vector, b_norm)
 
     # ---- Weighted total ----
+    # (the rhythm term is left out when it could not be computed)
     risk = (
         W1 * f_dev   +
         W2 * d_dev   +
         W3 * bg_dev  +
-        W4 * v_dist
+        (0.0 if too_short else W4 * v_dist)
     )
 
-    # ---- Dynamic threshold ----
-    threshold = dynamic_threshold(b_flight_std)
-
     # ---- Decision ----
-    status = "TRUSTED" if risk < threshold else "SUSPICIOUS"
-
-    return {
-        "flight_dev":  round(f_dev,   4),
-        "dwell_dev":   round(d_dev,   4),
-        "bigram_dev":  round(bg_dev,  4),
-        "vector_dist": round(v_dist,  4),
-        "cosine_sim":  round(cos_sim, 4),
-        "risk_score":  round(risk,    4),
-        "threshold":   round(threshold, 4),
-        "status":      status,
-    }
+    status = "TRUSTED" if risk < threshold and not too_short else "SUSPICIOUS"
+
+    # Values are returned unrounded; every display / log site formats them
+    # with :.4f, and the decision above already used the exact risk.
+    return RiskResult(
+        flight_dev  = f_dev,
+        dwell_dev   = d_dev,
+        bigram_dev  = bg_dev,
+        vector_dist = v_dist,
+        cosine_sim  = cos_sim,
+        risk_score  = risk,
+        threshold   = threshold,
+        status      = status,
+        reason      = INSUFFICIENT_DATA if too_short else "",
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -14,12 +14,16 @@ Baseline JSON schema (v2 – multi-metric):
   "dwell_avg":     0.09,
   "dwell_std":     0.03,
   "bigram_avg":    { "co": 0.19, "nt": 0.21 },
-  "rhythm_vector": [0.15, 0.20, 0.18, ...]
+  "rhythm_vector": [0.15, 0.20, 0.18, ...],
+  "rhythm_norm":   1.2345            (optional; ||rhythm_vector||)
 }
+
+The profile is written as a single compact JSON file, replaced atomically
+so an interrupted save never leaves a truncated profile behind.
 """
 
 import json
-import statistics
+import math
 import os
 
 import risk_engine
@@ -40,6 +44,107 @@ _REQUIRED_BASELINE_KEYS: dict[str, type] = {
 }
 
 
+def validate_baseline(baseline: dict) -> dict:
+    """
+    Check a loaded profile against _REQUIRED_BASELINE_KEYS and normalise
+    its numeric types, so the risk path always receives float scalars, a
+    {bigram: float} dict and a list of floats (JSON may hold ints).
+
+    Args:
+        baseline: Parsed baseline JSON (modified in place)
+
+    Returns:
+        The same dict
+
+    Raises:
+        ValueError: If a key is missing or holds the wrong kind of value
+    """
+    def _number(value):
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise TypeError
+        return float(value)
+
+    for key, expected in _REQUIRED_BASELINE_KEYS.items():
+        if key not in baseline:
+            raise ValueError(
+                f"Baseline profile is missing '{key}'. "
+                "Please re-register your baseline (Option 1)."
+            )
+        value = baseline[key]
+        try:
+            if expected is float:
+                baseline[key] = _number(value)
+            elif not isinstance(value, expected):
+                raise TypeError
+            elif expected is dict:
+                baseline[key] = {k: _number(v) for k, v in value.items()}
+            else:
+                baseline[key] = [_number(v) for v in value]
+        except TypeError:
+            raise ValueError(
+                f"Baseline profile field '{key}' is not a valid {expected.__name__}. "
+                "Please re-register your baseline (Option 1)."
+            ) from None
+    return baseline
+
+
+def _atomic_write(path: str, data: bytes) -> None:
+    """
+    Replace path with data so readers see either the old or the new file.
+
+    Written to a temporary file next to path, synced, then os.replace()d.
+    """
+    tmp = path + ".tmp"
+    try:
+        with open(tmp, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def _mean_std(values: list, default_std: float) -> tuple:
+    """
+    Mean and sample standard deviation of a non-empty float list.
+
+    Same results as statistics.mean / statistics.stdev to float precision,
+    without their exact Fraction arithmetic.
+
+    Args:
+        values      : Samples
+        default_std : Returned as the std when there is only one sample
+    """
+    n = len(values)
+    mean = math.fsum(values) / n
+    if n < 2:
+        return mean, default_std
+    var = math.fsum([(x - mean) * (x - mean) for x in values]) / (n - 1)
+    return mean, math.sqrt(var)
+
+
+def _precompute(baseline: dict) -> dict:
+    """
+    Attach derived, in-memory-only fields to a loaded baseline so the
+    verification path does not recompute them on every check.
+
+    Adds:
+        _rhythm_norm : Euclidean norm of rhythm_vector (used by cosine);
+                       taken from the stored "rhythm_norm" when present,
+                       computed for profiles saved before it existed
+    """
+    norm = baseline.get("rhythm_norm")
+    if isinstance(norm, bool) or not isinstance(norm, (int, float)):
+        norm = math.hypot(*baseline.get("rhythm_vector", ()))
+    baseline["_rhythm_norm"] = float(norm)
+    return baseline
+
+
 class TrustEngine:
     """
     Manages the user's behavioral biometric baseline and trust decisions.
@@ -49,6 +154,12 @@ class TrustEngine:
         self.baseline_file = baseline_file
         # No static threshold – dynamic_threshold() in risk_engine is used instead.
 
+        # Parsed baseline reused while the file's mtime is unchanged
+        self._cache        = None
+        self._cache_mtime  = None
+        self.cache_hits    = 0
+        self.cache_misses  = 0
+
     # ------------------------------------------------------------------
     # Baseline creation
     # ------------------------------------------------------------------
@@ -59,7 +170,8 @@ class TrustEngine:
 
         Args:
             data: Dict returned by keystroke.capture_keystrokes()
-                  Keys: flight_times, dwell_times, bigrams, rhythm_vector
+                  Keys: flight_times, dwell_times, bigrams, rhythm_vector,
+                  and optionally bigram_avg (per-bigram means)
 
         Returns:
             Baseline profile dict ready for save_baseline()
@@ -79,34 +191,40 @@ class TrustEngine:
             )
 
         # ---- Flight time statistics ----
-        flight_avg = statistics.mean(flight_times)
-        flight_std = (
-            statistics.stdev(flight_times) if len(flight_times) > 1 else 0.05
-        )
+        flight_avg, flight_std = _mean_std(flight_times, 0.05)
 
         # ---- Dwell time statistics ----
         if dwell_times:
-            dwell_avg = statistics.mean(dwell_times)
-            dwell_std = (
-                statistics.stdev(dwell_times) if len(dwell_times) > 1 else 0.02
-            )
+            dwell_avg, dwell_std = _mean_std(dwell_times, 0.02)
         else:
             dwell_avg, dwell_std = 0.0, 0.02
 
         # ---- Bigram averages (scalar per bigram for compact storage) ----
-        bigram_avg = {}
-        for bigram_key, times in bigrams.items():
-            if times:
-                bigram_avg[bigram_key] = round(statistics.mean(times), 4)
+        # Capture already averages each bigram; fall back to the raw lists
+        # for callers that only supply "bigrams".
+        captured_avg = data.get("bigram_avg")
+        if captured_avg is not None:
+            bigram_avg = {k: round(avg, 4) for k, avg in captured_avg.items()}
+        else:
+            bigram_avg = {
+                k: round(math.fsum(times) / len(times), 4)
+                for k, times in bigrams.items() if times
+            }
 
         # ---- Build profile ----
+        # Capture already rounds every flight time to 4 dp; only copy
+        rhythm = list(rhythm_vector)
         baseline = {
             "flight_avg":    round(flight_avg, 4),
             "flight_std":    round(flight_std, 4),
             "dwell_avg":     round(dwell_avg,  4),
             "dwell_std":     round(dwell_std,  4),
             "bigram_avg":    bigram_avg,
-            "rhythm_vector": [round(t, 4) for t in rhythm_vector],
+            "rhythm_vector": rhythm,
+            # Stored so verification never recomputes the baseline norm;
+            # kept unrounded (JSON round-trips floats exactly) because it
+            # stands in for the exact value in cosine_similarity()
+            "rhythm_norm":   math.hypot(*rhythm),
         }
 
         return baseline
@@ -122,16 +240,15 @@ class TrustEngine:
         Args:
             profile: Dict from create_baseline()
         """
-        with open(self.baseline_file, "w") as f:
-            json.dump(profile, f, indent=2)
+        # Compact separators: no per-float newline / indent in rhythm_vector
+        self._cache = None
+        _atomic_write(self.baseline_file,
+                      json.dumps(profile, separators=(",", ":")).encode("utf-8"))
         print(f"\n  Baseline profile saved -> {self.baseline_file}")
 
-    def load_baseline(self) -> dict:
+    def require_baseline(self) -> None:
         """
-        Load baseline profile from JSON.
-
-        Returns:
-            Baseline profile dict
+        Check that a baseline profile has been registered.
 
         Raises:
             FileNotFoundError: If no baseline exists yet
@@ -141,14 +258,55 @@ class TrustEngine:
                 f"Baseline file '{self.baseline_file}' not found. "
                 "Please register a baseline first (Option 1)."
             )
-        with open(self.baseline_file, "r") as f:
-            return json.load(f)
+
+    def load_baseline(self) -> dict:
+        """
+        Load baseline profile from JSON.
+
+        The parsed profile is cached against the file's mtime, so repeated
+        loads skip the disk read and JSON decode until the file changes.
+        The returned dict also carries "_id", a fingerprint of the file
+        contents (not persisted). It is only stable within one process,
+        so use it for in-memory identity checks and cache keys. Derived
+        fields from _precompute() are attached as well.
+
+        Returns:
+            Baseline profile dict
+
+        Raises:
+            FileNotFoundError: If no baseline exists yet
+            ValueError:        If the file is not a valid baseline profile
+        """
+        try:
+            mtime = os.stat(self.baseline_file).st_mtime_ns
+        except FileNotFoundError:
+            self._cache = None
+            self.require_baseline()   # raises with user guidance
+            raise
+
+        if self._cache is not None and mtime == self._cache_mtime:
+            self.cache_hits += 1
+            return self._cache
+
+        self.cache_misses += 1
+        with open(self.baseline_file, "rb") as f:
+            raw = f.read()
+        baseline = json.loads(raw)
+        if not isinstance(baseline, dict):
+            raise ValueError("Baseline profile is not a JSON object. "
+                             "Please re-register your baseline (Option 1).")
+
+        validate_baseline(baseline)
+        baseline["_id"] = hash(raw)
+        self._cache = _precompute(baseline)
+        self._cache_mtime = mtime
+        return self._cache
 
     # ------------------------------------------------------------------
     # Risk computation
     # ------------------------------------------------------------------
 
-    def compute_risk(self, current_data: dict, baseline: dict) -> dict:
+    def compute_risk(self, current_data: dict, baseline: dict) -> risk_engine.RiskResult:
         """
         Compute multi-factor risk score for a typing session.
 
@@ -157,11 +315,9 @@ class TrustEngine:
             baseline:     Dict from load_baseline()
 
         Returns:
-            Risk assessment dict from risk_engine.compute_multifactor_risk():
-            {
+            risk_engine.RiskResult from compute_multifactor_risk():
                 flight_dev, dwell_dev, bigram_dev, vector_dist,
-                cosine_sim, risk_score, threshold, status
-            }
+                cosine_sim, risk_score, threshold, status, reason
 
         Raises:
             ValueError: If insufficient keystroke data in current session
@@ -175,7 +331,7 @@ class TrustEngine:
     # Convenience: verify in one call
     # ------------------------------------------------------------------
 
-    def verify_user(self, current_data: dict) -> dict:
+    def verify_user(self, current_data: dict) -> risk_engine.RiskResult | dict:
         """
         Load baseline and compute risk in a single call.
 
@@ -183,7 +339,7 @@ class TrustEngine:
             current_data: Dict from keystroke.capture_keystrokes()
 
         Returns:
-            Risk assessment dict, or error dict if baseline missing
+            RiskResult, or error dict if baseline missing
         """
         try:
             baseline = self.load_baseline()
@@ -211,6 +367,6 @@ def load_baseline() -> dict:
     return TrustEngine().load_baseline()
 
 
-def compute_risk(current_data: dict, baseline: dict) -> dict:
+def compute_risk(current_data: dict, baseline: dict) -> risk_engine.RiskResult:
     """Module-level shortcut for TrustEngine().compute_risk()."""
     return TrustEngine().compute_risk(current_data, baseline)
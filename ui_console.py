@@ -12,17 +12,25 @@ IMPORTANT: This module contains ZERO authentication logic.
            It is purely a presentation / logging layer.
 """
 
+import atexit
+import functools
 import os
+import select
 import sys
 import time
-import datetime
+import math
+import threading
 
 import config
 
 # ---------------------------------------------------------------------------
-# Colorama initialization – graceful fallback if not installed
+# Colorama initialization – graceful fallback if not installed, and no
+# colours at all when stdout is redirected (colorama's stdout wrapper would
+# still parse every write)
 # ---------------------------------------------------------------------------
 try:
+    if not sys.stdout.isatty():
+        raise ImportError("stdout is not a terminal")
     from colorama import init as _colorama_init, Fore, Back, Style
     _colorama_init(autoreset=True)
     COLORS_AVAILABLE = True
@@ -38,81 +46,204 @@ except ImportError:
     Style = _Stub()
 
 
+# ---------------------------------------------------------------------------
+# Single-key input – termios on POSIX, msvcrt on Windows
+# ---------------------------------------------------------------------------
+try:
+    import termios
+    import tty
+except ImportError:
+    termios = None
+    import msvcrt
+
+
 # ---------------------------------------------------------------------------
 # Constants — sourced from config.py (single source of truth)
 # ---------------------------------------------------------------------------
 LOG_FILE   = os.path.join(os.path.dirname(os.path.abspath(__file__)),
                            config.LOG_FILE)
+LOG_FILE_PREV = LOG_FILE + ".1"   # previous log, kept by size rotation
 WIDTH      = config.UI_WIDTH
 BAR_WIDTH  = config.BAR_WIDTH
 FILLED_CHAR = config.FILLED_CHAR
 EMPTY_CHAR  = config.EMPTY_CHAR
 
-HEADER = f"""
-{Fore.CYAN}{'=' * WIDTH}
-{'  ZERO TRUST CONTINUOUS AUTHENTICATION ENGINE':^{WIDTH}}
-{'  Behavioral Biometrics Security Console  v2.0':^{WIDTH}}
-{'=' * WIDTH}{Style.RESET_ALL}
-{Fore.GREEN}  Behavioral Biometric Monitoring : ACTIVE
-  Trust Engine Status             : OPERATIONAL
-  Continuous Re-Verification      : ENABLED{Style.RESET_ALL}
-{Fore.CYAN}{'=' * WIDTH}{Style.RESET_ALL}"""
+# Rules reused by banners and tables
+_RULE        = "─" * WIDTH
+_DOUBLE_RULE = "=" * WIDTH
+_TABLE_RULE  = f"  {'─' * (WIDTH - 2)}"
 
+# Colour codes bound once ("" when colorama is unavailable or stdout is
+# not a terminal); Fore / Style stay importable for callers.
+_CYAN   = Fore.CYAN
+_GREEN  = Fore.GREEN
+_RED    = Fore.RED
+_YELLOW = Fore.YELLOW
+_WHITE  = Fore.WHITE
+_RESET  = Style.RESET_ALL
 
 # ---------------------------------------------------------------------------
 # 1. Screen refresh
 # ---------------------------------------------------------------------------
 
+_CLEAR_SCREEN = "\x1b[2J\x1b[H"   # erase display, cursor home
+
+
 def clear_screen() -> None:
-    """Clear the terminal screen (cross-platform)."""
-    os.system("cls" if os.name == "nt" else "clear")
+    """
+    Clear the terminal screen (cross-platform).
+
+    Uses the ANSI erase sequence instead of spawning clear / cls. The
+    Windows console only understands it through colorama, so cls is
+    kept there when colorama is unavailable. Redirected output is left
+    alone.
+    """
+    if not sys.stdout.isatty():
+        return
+    if termios is None and not COLORS_AVAILABLE:
+        os.system("cls")
+        return
+    sys.stdout.write(_CLEAR_SCREEN)
+    sys.stdout.flush()
 
 
 # ---------------------------------------------------------------------------
 # 2. Header
 # ---------------------------------------------------------------------------
 
+@functools.lru_cache(maxsize=1)
+def header() -> str:
+    """Return the security console header (built on first use)."""
+    return f"""
+{_CYAN}{_DOUBLE_RULE}
+{'  ZERO TRUST CONTINUOUS AUTHENTICATION ENGINE':^{WIDTH}}
+{'  Behavioral Biometrics Security Console  v2.0':^{WIDTH}}
+{_DOUBLE_RULE}{_RESET}
+{_GREEN}  Behavioral Biometric Monitoring : ACTIVE
+  Trust Engine Status             : OPERATIONAL
+  Continuous Re-Verification      : ENABLED{_RESET}
+{_CYAN}{_DOUBLE_RULE}{_RESET}"""
+
+
+def __getattr__(name: str):
+    # ui_console.HEADER is kept for backward compatibility; see header()
+    if name == "HEADER":
+        return header()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def print_header() -> None:
     """Print the security console header."""
-    print(HEADER)
+    print(header())
+
+
+def emit(*lines: str) -> None:
+    """
+    Write a whole screen section with a single stdout write.
+
+    Args:
+        lines : Already-formatted lines; joined with newlines
+    """
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
 
 
 def section_banner(title: str, color: str = "") -> None:
     """Print a section divider with a title."""
-    reset = Style.RESET_ALL if COLORS_AVAILABLE else ""
-    bar   = "─" * WIDTH
-    print(f"\n{color}{bar}")
-    print(f"  {title}")
-    print(f"{bar}{reset}")
+    emit(*banner_lines(title, color))
+
+
+def banner_lines(title: str, color: str = "") -> list[str]:
+    """Return the lines of a section divider (for emit())."""
+    return [f"\n{color}{_RULE}", f"  {title}", f"{_RULE}{_RESET}"]
 
 
 # ---------------------------------------------------------------------------
 # 3. Color-coded status printers
 # ---------------------------------------------------------------------------
 
+def trusted_line(message: str) -> str:
+    """Return a TRUSTED / success line in green (for emit())."""
+    return f"{_GREEN}  {message}{_RESET}"
+
+
+def alert_line(message: str) -> str:
+    """Return a SUSPICIOUS / alert line in red (for emit())."""
+    return f"{_RED}  {message}{_RESET}"
+
+
+def info_line(message: str) -> str:
+    """Return an INFO/neutral line in cyan (for emit())."""
+    return f"{_CYAN}  {message}{_RESET}"
+
+
 def print_trusted(message: str) -> None:
     """Print a TRUSTED / success message in green."""
-    print(f"{Fore.GREEN}  {message}{Style.RESET_ALL}")
+    print(trusted_line(message))
 
 
 def print_alert(message: str) -> None:
     """Print a SUSPICIOUS / alert message in red."""
-    print(f"{Fore.RED}  {message}{Style.RESET_ALL}")
+    print(alert_line(message))
 
 
 def print_warning(message: str) -> None:
     """Print a WARNING message in yellow."""
-    print(f"{Fore.YELLOW}  {message}{Style.RESET_ALL}")
+    print(f"{_YELLOW}  {message}{_RESET}")
 
 
 def print_info(message: str) -> None:
     """Print an INFO/neutral message in cyan."""
-    print(f"{Fore.CYAN}  {message}{Style.RESET_ALL}")
+    print(info_line(message))
+
+
+def label_line(label: str, value: str, width: int = 40) -> str:
+    """Return a key-value line, label in white and value in cyan (for emit())."""
+    return f"  {label.ljust(width)}{_CYAN}{value}{_RESET}"
 
 
 def print_label(label: str, value: str, width: int = 40) -> None:
     """Print a key-value pair with label in white and value in cyan."""
-    print(f"  {label:<{width}}{Fore.CYAN}{value}{Style.RESET_ALL}")
+    sys.stdout.write(label_line(label, value, width) + "\n")
+
+
+def read_choice(prompt: str) -> str:
+    """
+    Read a menu choice.
+
+    On an interactive terminal the first keypress is returned at once
+    (and echoed) without waiting for Enter; keys typed before the prompt
+    appeared are discarded. When stdin is not a terminal a whole line is
+    read with input(), so piped input keeps working.
+
+    Raises:
+        EOFError, KeyboardInterrupt
+    """
+    if not sys.stdin.isatty():
+        return input(prompt).strip()
+
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    if termios is not None:
+        fd  = sys.stdin.fileno()
+        old = termios.tcgetattr(fd)
+        try:
+            termios.tcflush(fd, termios.TCIFLUSH)
+            tty.setcbreak(fd)
+            ch = sys.stdin.read(1)
+        finally:
+            termios.tcsetattr(fd, termios.TCSADRAIN, old)
+    else:
+        while msvcrt.kbhit():
+            msvcrt.getwch()
+        ch = msvcrt.getwch()
+
+    if ch == "\x03":
+        raise KeyboardInterrupt
+    if ch in ("", "\x04", "\x1a"):
+        raise EOFError
+    print(ch if ch.isprintable() else "")
+    return ch.strip()
 
 
 # ---------------------------------------------------------------------------
@@ -123,8 +254,13 @@ def print_label(label: str, value: str, width: int = 40) -> None:
 
 
 def display_risk_bar(risk: float, threshold: float) -> None:
+    """Display a visual risk progress bar (see risk_bar_lines())."""
+    emit(*risk_bar_lines(risk, threshold))
+
+
+def risk_bar_lines(risk: float, threshold: float) -> list[str]:
     """
-    Display a visual risk progress bar.
+    Build the lines of the visual risk progress bar.
 
     Normalises the risk score against 2× the threshold so that a score
     exactly at threshold lands at 50% and critical scores fill the bar.
@@ -133,6 +269,9 @@ def display_risk_bar(risk: float, threshold: float) -> None:
     Args:
         risk      : Weighted risk score from risk_engine
         threshold : Adaptive threshold from risk_engine
+
+    Returns:
+        The score line and the bar line
     """
     # Normalise: we consider 2 × threshold as the "full bar" point
     scale        = max(threshold * 2, 0.001)
@@ -145,22 +284,108 @@ def display_risk_bar(risk: float, threshold: float) -> None:
 
     # Colour the bar based on severity
     if risk < threshold * 0.6:
-        bar_color = Fore.GREEN
+        bar_color = _GREEN
     elif risk < threshold:
-        bar_color = Fore.YELLOW
+        bar_color = _YELLOW
     else:
-        bar_color = Fore.RED
+        bar_color = _RED
 
-    reset = Style.RESET_ALL
-    print(f"\n  Risk Score   : {Fore.CYAN}{risk:.4f}{reset}  "
-          f"Threshold: {Fore.CYAN}{threshold:.4f}{reset}")
-    print(f"  Risk Level   : {bar_color}{bar_str}{reset}  {pct}%")
+    return [
+        f"\n  Risk Score   : {_CYAN}{risk:.4f}{_RESET}  "
+        f"Threshold: {_CYAN}{threshold:.4f}{_RESET}",
+        f"  Risk Level   : {bar_color}{bar_str}{_RESET}  {pct}%",
+    ]
 
 
 # ---------------------------------------------------------------------------
 # 5. Security event logging
 # ---------------------------------------------------------------------------
 
+# (epoch second, formatted stamp) of the last entry; events in a burst
+# usually share a second and reuse the string
+_ts_cache = (None, "")
+
+
+def format_log_entry(level: str, message: str, when: float | None = None) -> str:
+    """
+    Format one security_log.txt line.
+
+    Args:
+        level   : "INFO" | "ALERT" | "LOCK" | "WARN" | "BOOT" | "EXIT"
+        message : Human-readable event description
+        when    : time.time() timestamp of the event (default: now)
+    """
+    global _ts_cache
+    sec = int(time.time() if when is None else when)
+    cached_sec, ts = _ts_cache
+    if sec != cached_sec:
+        ts = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(sec))
+        _ts_cache = (sec, ts)   # one tuple, so other threads never see a torn pair
+    return f"[{ts}] [{level:<5}] {message}\n"
+
+
+# LOG_FILE is opened once (append mode, line-buffered) on the first write
+# and kept open until interpreter exit. A failed write drops the handle
+# so the next write reopens the path (e.g. after log rotation). Batching
+# is left to the caller (main.py's background log writer).
+#
+# The file's size is checked every LOG_ROTATE_CHECK_EVERY writes (and on
+# the first one); past LOG_MAX_BYTES it is renamed to LOG_FILE_PREV,
+# replacing the previous one, and a fresh file is started.
+_LOG_FH         = None
+_LOG_LOCK       = threading.Lock()
+_writes_until_size_check = 0
+
+
+def _write_locked(text: str) -> None:
+    """Write text to LOG_FILE, opening it if needed (hold _LOG_LOCK)."""
+    global _LOG_FH, _writes_until_size_check
+    try:
+        if _LOG_FH is None:
+            _LOG_FH = open(LOG_FILE, "a", encoding="utf-8", buffering=1)
+        _LOG_FH.write(text)
+        _writes_until_size_check -= 1
+        if _writes_until_size_check <= 0:
+            _writes_until_size_check = config.LOG_ROTATE_CHECK_EVERY
+            if os.fstat(_LOG_FH.fileno()).st_size > config.LOG_MAX_BYTES:
+                _rotate_locked()
+    except (OSError, ValueError):
+        _LOG_FH = None   # reopen next time; logging must never crash the auth flow
+
+
+def _rotate_locked() -> None:
+    """Move LOG_FILE to LOG_FILE_PREV and reopen it empty (hold _LOG_LOCK)."""
+    global _LOG_FH
+    _LOG_FH.close()
+    _LOG_FH = None
+    os.replace(LOG_FILE, LOG_FILE_PREV)
+    _LOG_FH = open(LOG_FILE, "a", encoding="utf-8", buffering=1)
+
+
+def write_log_entries(entries: list[str]) -> None:
+    """
+    Append already-formatted entries to security_log.txt in a single write.
+
+    Args:
+        entries : Lines produced by format_log_entry()
+    """
+    text = "".join(entries)
+    with _LOG_LOCK:
+        _write_locked(text)
+
+
+def _close_log() -> None:
+    """atexit hook: close the log handle."""
+    global _LOG_FH
+    with _LOG_LOCK:
+        if _LOG_FH is not None:
+            _LOG_FH.close()
+            _LOG_FH = None
+
+
+atexit.register(_close_log)
+
+
 def log_event(level: str, message: str) -> None:
     """
     Append a timestamped security event to security_log.txt.
@@ -169,71 +394,112 @@ def log_event(level: str, message: str) -> None:
         level   : "INFO" | "ALERT" | "LOCK" | "WARN" | "BOOT" | "EXIT"
         message : Human-readable event description
     """
-    ts = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    entry = f"[{ts}] [{level:<5}] {message}\n"
-    try:
-        with open(LOG_FILE, "a", encoding="utf-8") as f:
-            f.write(entry)
-    except OSError:
-        pass   # Logging must never crash the auth flow
+    write_log_entries([format_log_entry(level, message)])
 
 
 # ---------------------------------------------------------------------------
 # 6. Formatted risk table (replaces plain _print_risk_table in main.py)
 # ---------------------------------------------------------------------------
 
-def print_risk_table(assessment: dict, label: str = "AUTHENTICATION RESULT") -> None:
+# (label, RiskResult field, unit) for the per-signal rows of the risk table
+_COMPONENT_ROWS = (
+    ("Flight Time Deviation",   "flight_dev",  " s"),
+    ("Dwell Time Deviation",    "dwell_dev",   " s"),
+    ("Bigram Timing Deviation", "bigram_dev",  " s"),
+    ("Rhythm Vector Distance",  "vector_dist", ""),
+    ("Cosine Similarity",       "cosine_sim",  ""),
+)
+
+
+def _row_line(metric: str, value: str) -> str:
+    """One metric / value row of the risk table."""
+    return f"  {metric:<32} {_CYAN}{value}{_RESET}"
+
+
+def print_risk_table(assessment: tuple, label: str = "AUTHENTICATION RESULT") -> None:
     """
     Print a color-coded risk breakdown table and risk bar.
 
     Args:
-        assessment : Dict from TrustEngine.compute_risk() / risk_engine
+        assessment : RiskResult from TrustEngine.compute_risk() / risk_engine
         label      : Title for the table
     """
-    status    = assessment.get("status", "UNKNOWN")
+    status    = assessment.status
+    risk      = assessment.risk_score
+    threshold = assessment.threshold
     trusted   = (status == "TRUSTED")
-    hdr_color = Fore.GREEN if trusted else Fore.RED
-    reset     = Style.RESET_ALL
-
-    def row(metric, value):
-        print(f"  {metric:<32} {Fore.CYAN}{value}{reset}")
-
-    print(f"\n{hdr_color}{'=' * WIDTH}{reset}")
-    print(f"{hdr_color}  {label:^{WIDTH - 2}}{reset}")
-    print(f"{hdr_color}{'=' * WIDTH}{reset}")
-
-    print(f"  {'Metric':<32} {'Score'}")
-    print(f"  {'─' * (WIDTH - 2)}")
-    row("Flight Time Deviation",    f"{assessment.get('flight_dev',  0):.4f} s")
-    row("Dwell Time Deviation",     f"{assessment.get('dwell_dev',   0):.4f} s")
-    row("Bigram Timing Deviation",  f"{assessment.get('bigram_dev',  0):.4f} s")
-    row("Rhythm Vector Distance",   f"{assessment.get('vector_dist', 0):.4f}")
-    row("Cosine Similarity",        f"{assessment.get('cosine_sim',  0):.4f}")
-    print(f"  {'─' * (WIDTH - 2)}")
-    row("Weighted Risk Score",      f"{assessment.get('risk_score',  0):.4f}")
-    row("Adaptive Threshold",       f"{assessment.get('threshold',   0):.4f}")
-    print(f"  {'─' * (WIDTH - 2)}")
+    hdr_color = _GREEN if trusted else _RED
+
+    # Collected and written once so the table appears in a single update
+    out = [
+        f"\n{hdr_color}{_DOUBLE_RULE}{_RESET}",
+        f"{hdr_color}  {label:^{WIDTH - 2}}{_RESET}",
+        f"{hdr_color}{_DOUBLE_RULE}{_RESET}",
+        f"  {'Metric':<32} {'Score'}",
+        _TABLE_RULE,
+    ]
+    for metric, key, unit in _COMPONENT_ROWS:
+        value = getattr(assessment, key)
+        # nan marks a metric the risk engine could not compute
+        out.append(_row_line(metric, "n/a" if value != value else f"{value:.4f}{unit}"))
+    out += [
+        _TABLE_RULE,
+        _row_line("Weighted Risk Score", f"{risk:.4f}"),
+        _row_line("Adaptive Threshold",  f"{threshold:.4f}"),
+        _TABLE_RULE,
+    ]
 
     # Risk bar
-    display_risk_bar(
-        assessment.get("risk_score", 0.0),
-        max(assessment.get("threshold", 0.1), 0.001),
-    )
+    out.extend(risk_bar_lines(risk, max(threshold, 0.001)))
 
     # Status line
-    print()
+    out.append("")
     if trusted:
-        print_trusted(f"[TRUSTED]   Identity verified. Behavioral pattern matches baseline.")
+        out.append(trusted_line("[TRUSTED]   Identity verified. Behavioral pattern matches baseline."))
+    elif assessment.reason == "INSUFFICIENT_DATA":
+        out.append(alert_line("[ALERT]     Too little typing rhythm to compare with the baseline "
+                              "(INSUFFICIENT_DATA)."))
     else:
-        print_alert(f"[ALERT]     Behavioral anomaly detected. Pattern does NOT match baseline.")
+        out.append(alert_line("[ALERT]     Behavioral anomaly detected. Pattern does NOT match baseline."))
 
-    print(f"{hdr_color}{'=' * WIDTH}{reset}")
+    out.append(f"{hdr_color}{_DOUBLE_RULE}{_RESET}")
+    emit(*out)
 
 
 # ---------------------------------------------------------------------------
 # 7. Log viewer
 # ---------------------------------------------------------------------------
 
+def _tail(path: str, n: int, block: int = 8192) -> list[str]:
+    """
+    Return the last n lines of a text file.
+
+    Reads backwards from the end in fixed-size blocks until more than n
+    newlines have been seen, so the cost does not grow with the file.
+    """
+    with open(path, "rb") as f:
+        pos = f.seek(0, os.SEEK_END)
+        buf = b""
+        while pos > 0 and buf.count(b"\n") <= n:
+            step = min(block, pos)
+            pos -= step
+            f.seek(pos)
+            buf = f.read(step) + buf
+    return buf.decode("utf-8", "replace").splitlines()[-n:]
+
+
+# Every entry starts "[YYYY-mm-dd HH:MM:SS] [LEVEL] ", so the padded level
+# sits at a fixed offset; anything else (e.g. a malformed line) is cyan.
+_LEVEL_SLICE = slice(23, 28)
+_LEVEL_COLOR = {
+    "ALERT": _RED,
+    "LOCK ": _RED,
+    "WARN ": _YELLOW,
+    "BOOT ": _GREEN,
+    "INFO ": _GREEN,
+}
+
+
 def view_security_logs(max_lines: int = 40) -> None:
     """
     Display the last N lines of security_log.txt in the terminal.
@@ -241,35 +507,34 @@ def view_security_logs(max_lines: int = 40) -> None:
     Args:
         max_lines: Maximum number of recent log entries to display
     """
-    section_banner("SECURITY EVENT LOG", Fore.CYAN)
+    out = banner_lines("SECURITY EVENT LOG", _CYAN)
     if not os.path.exists(LOG_FILE):
-        print_warning("No security log file found yet. Events will appear after first use.")
+        emit(*out, f"{_YELLOW}  No security log file found yet. "
+                   f"Events will appear after first use.{_RESET}")
         return
 
     try:
-        with open(LOG_FILE, "r", encoding="utf-8") as f:
-            lines = f.readlines()
-
-        if not lines:
-            print_info("Log file is empty.")
-            return
-
-        recent = lines[-max_lines:]
-        print(f"{Fore.CYAN}  Showing last {len(recent)} of {len(lines)} events:{Style.RESET_ALL}\n")
-
-        for line in recent:
-            line = line.rstrip()
-            if "[ALERT]" in line or "[LOCK ]" in line:
-                print(f"  {Fore.RED}{line}{Style.RESET_ALL}")
-            elif "[WARN ]" in line:
-                print(f"  {Fore.YELLOW}{line}{Style.RESET_ALL}")
-            elif "[BOOT ]" in line or "[INFO ]" in line:
-                print(f"  {Fore.GREEN}{line}{Style.RESET_ALL}")
-            else:
-                print(f"  {Fore.CYAN}{line}{Style.RESET_ALL}")
-
+        recent = _tail(LOG_FILE, max_lines)
+        # Just after a rotation the current file may be short; top it up
+        # from the end of the previous one
+        if len(recent) < max_lines and os.path.exists(LOG_FILE_PREV):
+            recent = _tail(LOG_FILE_PREV, max_lines - len(recent)) + recent
     except OSError as e:
-        print_alert(f"Could not read log file: {e}")
+        emit(*out, alert_line(f"Could not read log file: {e}"))
+        return
+
+    if not recent:
+        emit(*out, info_line("Log file is empty."))
+        return
+
+    out.append(f"{_CYAN}  Showing last {len(recent)} events:{_RESET}\n")
+
+    # Written with one stdout write once every line is formatted
+    for line in recent:
+        line  = line.rstrip()
+        color = _LEVEL_COLOR.get(line[_LEVEL_SLICE], _CYAN)
+        out.append(f"  {color}{line}{_RESET}")
+    emit(*out)
 
 
 # ---------------------------------------------------------------------------
@@ -277,95 +542,205 @@ def view_security_logs(max_lines: int = 40) -> None:
 # ---------------------------------------------------------------------------
 
 def view_trust_diagnostics(
-    trust_engine,
-    last_assessment: dict | None = None,
+    baseline: dict | None,
+    last_assessment: tuple | None = None,
     threshold: float | None = None,
+    session_stats: dict | None = None,
 ) -> None:
     """
     Display read-only diagnostic metrics from the loaded baseline profile.
 
     Args:
-        trust_engine    : TrustEngine instance (for .load_baseline())
-        last_assessment : Most recent risk assessment dict, or None
+        baseline        : Loaded baseline profile, or None if none exists
+                          (the caller loads it once, so the cache counters
+                          it reports are not inflated by this view)
+        last_assessment : Most recent RiskResult, or None
         threshold       : Pre-computed adaptive threshold (avoids importing
                           risk_engine here — caller computes and passes it)
+        session_stats   : Optional {label: value} pairs describing the
+                          running session (shown as-is, already formatted)
     """
-    section_banner("TRUST ENGINE DIAGNOSTICS  [READ-ONLY]", Fore.CYAN)
+    out = banner_lines("TRUST ENGINE DIAGNOSTICS  [READ-ONLY]", _CYAN)
 
-    try:
-        baseline = trust_engine.load_baseline()
-    except FileNotFoundError:
-        print_warning("No baseline profile found. Please register first (Option 1).")
+    if baseline is None:
+        emit(*out, f"{_YELLOW}  No baseline profile found. "
+                   f"Please register first (Option 1).{_RESET}")
         return
 
     # Threshold comes from the caller; fall back to config-based calculation
     # only if not provided, to keep this module free of risk_engine imports.
     if threshold is None:
-        flight_std = baseline.get("flight_std", config.FLOOR_STD)
-        threshold  = max(flight_std, config.FLOOR_STD) * config.THRESHOLD_K
-
-    print(f"\n{Fore.CYAN}  --- Baseline Profile ---{Style.RESET_ALL}")
-    print_label("Flight time average  :",   f"{baseline.get('flight_avg', 0):.4f} s")
-    print_label("Flight time std dev  :",   f"{baseline.get('flight_std', 0):.4f} s")
-    print_label("Dwell time average   :",   f"{baseline.get('dwell_avg',  0):.4f} s")
-    print_label("Dwell time std dev   :",   f"{baseline.get('dwell_std',  0):.4f} s")
-    print_label("Adaptive threshold   :",   f"{threshold:.4f}")
-    print_label("Bigrams in profile   :",   str(len(baseline.get("bigram_avg", {}))))
-    print_label("Rhythm vector length :",   str(len(baseline.get("rhythm_vector", []))))
-
-    bigrams = baseline.get("bigram_avg", {})
+        threshold = max(baseline["flight_std"], config.FLOOR_STD) * config.THRESHOLD_K
+
+    # The whole report is written with one stdout write
+    out += [
+        f"\n{_CYAN}  --- Baseline Profile ---{_RESET}",
+        label_line("Flight time average  :",   f"{baseline['flight_avg']:.4f} s"),
+        label_line("Flight time std dev  :",   f"{baseline['flight_std']:.4f} s"),
+        label_line("Dwell time average   :",   f"{baseline['dwell_avg']:.4f} s"),
+        label_line("Dwell time std dev   :",   f"{baseline['dwell_std']:.4f} s"),
+        label_line("Adaptive threshold   :",   f"{threshold:.4f}"),
+        label_line("Bigrams in profile   :",   str(len(baseline["bigram_avg"]))),
+        label_line("Rhythm vector length :",   str(len(baseline["rhythm_vector"]))),
+    ]
+
+    bigrams = baseline["bigram_avg"]
     if bigrams:
-        print(f"\n{Fore.CYAN}  --- Bigram Averages ---{Style.RESET_ALL}")
+        out.append(f"\n{_CYAN}  --- Bigram Averages ---{_RESET}")
         for i, (bg, avg) in enumerate(list(bigrams.items())[:10]):
-            print(f"  {Fore.WHITE}  '{bg}'{Style.RESET_ALL} -> {Fore.CYAN}{avg:.4f} s{Style.RESET_ALL}")
+            out.append(f"  {_WHITE}  '{bg}'{_RESET} -> {_CYAN}{avg:.4f} s{_RESET}")
         if len(bigrams) > 10:
-            print(f"  {Fore.CYAN}  ... and {len(bigrams) - 10} more{Style.RESET_ALL}")
+            out.append(f"  {_CYAN}  ... and {len(bigrams) - 10} more{_RESET}")
+
+    if session_stats:
+        out.append(f"\n{_CYAN}  --- Session Statistics ---{_RESET}")
+        for label, value in session_stats.items():
+            out.append(label_line(label, value))
 
     if last_assessment:
-        print(f"\n{Fore.CYAN}  --- Last Session Result ---{Style.RESET_ALL}")
-        print_label("Risk score  :",  f"{last_assessment.get('risk_score', 0):.4f}")
-        print_label("Threshold   :",  f"{last_assessment.get('threshold',  0):.4f}")
-        status = last_assessment.get("status", "N/A")
+        out.append(f"\n{_CYAN}  --- Last Session Result ---{_RESET}")
+        out.append(label_line("Risk score  :",  f"{last_assessment.risk_score:.4f}"))
+        out.append(label_line("Threshold   :",  f"{last_assessment.threshold:.4f}"))
+        status = last_assessment.status
         if status == "TRUSTED":
-            print_label("Status      :", f"{Fore.GREEN}{status}{Style.RESET_ALL}")
+            out.append(label_line("Status      :", f"{_GREEN}{status}{_RESET}"))
         else:
-            print_label("Status      :", f"{Fore.RED}{status}{Style.RESET_ALL}")
+            out.append(label_line("Status      :", f"{_RED}{status}{_RESET}"))
     else:
-        print(f"\n{Fore.YELLOW}  No session data available. Run Option 2 or 3 first.{Style.RESET_ALL}")
+        out.append(f"\n{_YELLOW}  No session data available. Run Option 2 or 3 first.{_RESET}")
+    emit(*out)
 
 
 # ---------------------------------------------------------------------------
 # 9. Countdown display
 # ---------------------------------------------------------------------------
 
-def countdown_display(seconds: int, label: str = "Re-verification") -> bool:
+_COUNTDOWN_BAR_W = 20
+# Every possible countdown bar, indexed by the number of filled cells
+_BARS = tuple("\u2588" * i + "\u2591" * (_COUNTDOWN_BAR_W - i)
+              for i in range(_COUNTDOWN_BAR_W + 1))
+# One countdown line: % (bar, seconds remaining); ends in \r to redraw in place
+_TICK_FMT = f"  {_CYAN}[%s]{_RESET} {_YELLOW}%3ds{_RESET} remaining...\r"
+
+# Byte versions for writing ticks straight to a POSIX terminal's fd
+_TTY_ENCODING    = getattr(sys.stdout, "encoding", None) or "utf-8"
+_TICK_FMT_BYTES  = _TICK_FMT.encode(_TTY_ENCODING, "replace")
+_BARS_BYTES      = tuple(b.encode(_TTY_ENCODING, "replace") for b in _BARS)
+_CLEAR_TICK      = " " * 70 + "\r"
+_SKIP_POLL       = 0.25   # max seconds between stop_event checks while watching stdin
+
+
+def _tick_fd() -> int | None:
+    """
+    File descriptor countdown ticks can be written to directly, or None.
+
+    Only used for a POSIX terminal; elsewhere (Windows, where colorama
+    must translate the ANSI codes, or redirected output) ticks go through
+    sys.stdout. Flushes sys.stdout so earlier output stays in order.
+    """
+    if termios is None:
+        return None
+    try:
+        if not sys.stdout.isatty():
+            return None
+        fd = sys.stdout.fileno()
+    except (AttributeError, ValueError, OSError):
+        return None
+    sys.stdout.flush()
+    return fd
+
+
+def _stdin_is_tty() -> bool:
+    try:
+        return sys.stdin.isatty()
+    except (AttributeError, ValueError):
+        return False
+
+
+def countdown_display(
+    seconds: int,
+    label: str = "Re-verification",
+    stop_event=None,
+    allow_skip: bool = False,
+) -> bool:
     """
     Display a live countdown. Returns False if interrupted by Ctrl+C.
 
+    When a threading.Event is passed as stop_event the countdown can run
+    on a background thread: it waits on the event between redraws and
+    stops as soon as the event is set.
+
+    With allow_skip on a POSIX terminal, pressing Enter ends the countdown
+    at once; input typed before the countdown started is discarded. It
+    counts as completed, and stop_event is set so a waiting caller wakes.
+    stdin is watched with select(), polling stop_event every _SKIP_POLL
+    seconds.
+
     Args:
-        seconds : Total seconds to count down
-        label   : Label to show in the countdown line
+        seconds    : Total seconds to count down
+        label      : Label to show in the countdown line
+        stop_event : Optional threading.Event that ends the countdown early
+        allow_skip : Let Enter finish the countdown immediately
 
     Returns:
-        True if countdown completed normally, False if Ctrl+C was pressed
+        True if countdown completed normally (or was skipped), False if
+        Ctrl+C was pressed or stop_event was set
     """
-    print(f"\n{Fore.CYAN}  Monitoring Session...{Style.RESET_ALL}")
+    watch_stdin = allow_skip and termios is not None and _stdin_is_tty()
+    print(f"\n{_CYAN}  Monitoring Session...{_RESET}")
     print(f"  {label} in: {seconds}s")
-    print(f"  (Press Ctrl+C to end session early.)")
+    if watch_stdin:
+        print(f"  (Press Enter to start {label.lower()} now, Ctrl+C to end session early.)")
+    else:
+        print(f"  (Press Ctrl+C to end session early.)")
+    if watch_stdin:
+        # Only an Enter pressed during the countdown counts: the phrase
+        # typed for the last capture (and the Enter after ':q') is still
+        # in the terminal's line buffer, so discard it like read_choice()
+        try:
+            termios.tcflush(sys.stdin.fileno(), termios.TCIFLUSH)
+        except (termios.error, OSError, ValueError):
+            watch_stdin = False
     try:
-        for remaining in range(seconds, 0, -1):
-            bar_w   = 20
-            filled  = int((seconds - remaining) / seconds * bar_w)
-            bar     = "\u2588" * filled + "\u2591" * (bar_w - filled)
-            print(
-                f"  {Fore.CYAN}[{bar}]{Style.RESET_ALL} "
-                f"{Fore.YELLOW}{remaining:>3}s{Style.RESET_ALL} remaining...",
-                end="\r",
-                flush=True,
-            )
-            time.sleep(1)
-        print(" " * 70, end="\r")   # clear line
+        # Redraws are scheduled against a monotonic deadline, so the
+        # countdown does not drift by the time spent drawing each tick.
+        deadline = time.monotonic() + seconds
+        shown    = None
+        fd       = _tick_fd()
+        while (left := deadline - time.monotonic()) > 0:
+            remaining = math.ceil(left)          # whole seconds shown
+            if remaining != shown:
+                shown  = remaining
+                filled = int((seconds - remaining) / seconds * _COUNTDOWN_BAR_W)
+                if fd is not None:
+                    os.write(fd, _TICK_FMT_BYTES % (_BARS_BYTES[filled], remaining))
+                else:
+                    sys.stdout.write(_TICK_FMT % (_BARS[filled], remaining))
+                    sys.stdout.flush()
+            # Sleep until the displayed second next changes
+            wait = left - (remaining - 1)
+            if watch_stdin:
+                if select.select([sys.stdin], [], [], min(wait, _SKIP_POLL))[0]:
+                    if sys.stdin.readline():
+                        sys.stdout.write(_CLEAR_TICK)
+                        sys.stdout.flush()
+                        if stop_event is not None:
+                            stop_event.set()
+                        return True
+                    watch_stdin = False          # EOF: stop watching stdin
+                if stop_event is not None and stop_event.is_set():
+                    sys.stdout.write(_CLEAR_TICK)
+                    sys.stdout.flush()
+                    return False
+            elif stop_event is None:
+                time.sleep(wait)
+            elif stop_event.wait(wait):
+                sys.stdout.write(_CLEAR_TICK)
+                sys.stdout.flush()
+                return False
+        sys.stdout.write(_CLEAR_TICK)
+        sys.stdout.flush()
         return True
     except KeyboardInterrupt:
-        print(f"\n{Fore.YELLOW}  Session ended by user (Ctrl+C).{Style.RESET_ALL}")
+        print(f"\n{_YELLOW}  Session ended by user (Ctrl+C).{_RESET}")
         return False